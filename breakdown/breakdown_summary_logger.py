@@ -40,8 +40,9 @@ def log_completion_summary(task_tracker: TaskTracker, execution_log: ExecutionLo
         avg_points = total_story_points / total_subtasks if total_subtasks > 0 else 0
         estimated_days = total_story_points / 5 if total_story_points > 0 else 0
 
-        # Format summary
-        completion_summary = (
+        # Format summary; sections are collected in a list and joined once rather than
+        # grown with += inside the per-task loop
+        summary_parts = [
             f"\nTask Breakdown Completion Report\n"
             f"===============================\n\n"
             f"High-Level Tasks:\n"
@@ -64,18 +65,19 @@ def log_completion_summary(task_tracker: TaskTracker, execution_log: ExecutionLo
             f"- Required skills: {', '.join(sorted(skills_required))}\n\n"
 
             f"Breakdown by Parent Task:\n"
-        )
+        ]
 
         # Add per-task breakdown
         for parent, count in summary['subtasks_by_parent'].items():
             parent_subtasks = task_tracker.subtasks.get(parent, [])
             parent_points = sum(subtask.get('story_points', 0) for subtask in parent_subtasks)
-            completion_summary += (
+            summary_parts.append(
                 f"- {parent}:\n"
                 f"  • Subtasks: {count}\n"
                 f"  • Story Points: {parent_points}\n"
                 f"  • Required Skills: {', '.join(sorted(set(skill for subtask in parent_subtasks for skill in subtask.get('required_skills', []))))}\n"
             )
+        completion_summary = "".join(summary_parts)
 
         # Log the summary
         logger.info(completion_summary)
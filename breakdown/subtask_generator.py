@@ -100,7 +100,7 @@ class SubtaskGenerator:
                 except Exception as e:
                     error_msg = f"Failed to break down task {task.title}"
                     logger.error(f"{error_msg}: {str(e)}")
-                    logger.error(f"Task details: {json.dumps(task.model_dump(), indent=2)}")
+                    logger.opt(lazy=True).error("Task details: {}", lambda: json.dumps(task.model_dump(), indent=2))
                     logger.exception("Full traceback:")
                     raise
 
@@ -109,7 +109,10 @@ class SubtaskGenerator:
 
         except Exception as e:
             logger.error(f"Failed to break down tasks: {str(e)}")
-            logger.error(f"High-level tasks: {json.dumps([t.model_dump() for t in high_level_tasks], indent=2)}")
+            logger.opt(lazy=True).error(
+                "High-level tasks: {}",
+                lambda: json.dumps([t.model_dump() for t in high_level_tasks], indent=2)
+            )
             logger.exception("Full traceback:")
             raise
 
@@ -139,7 +142,7 @@ class SubtaskGenerator:
 
         except Exception as e:
             logger.error(f"Failed to generate subtasks: {str(e)}")
-            logger.error(f"Parent task: {json.dumps(parent_task, indent=2)}")
+            logger.opt(lazy=True).error("Parent task: {}", lambda: json.dumps(parent_task, indent=2))
             logger.exception("Full traceback:")
             raise
 
@@ -175,12 +175,12 @@ class BaseJiraOperation:
                     # Just return the data as is, assuming it's already in the expected format
                     result = issue_data
 
-                logger.debug(f"Extracted issue data structure: {result}")
+                logger.debug("Extracted issue data structure: {}", result)
                 return result
 
             except KeyError as e:
                 logger.error(f"Failed to extract issue data - missing field: {str(e)}")
-                logger.debug(f"Raw issue data: {issue_data}")
+                logger.debug("Raw issue data: {}", issue_data)
                 return None
 
         except Exception as e:
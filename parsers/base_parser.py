@@ -1,10 +1,19 @@
 import re
-from typing import Dict, Any, List, Optional, Union, LiteralString
+from typing import Dict, Any, Iterator, List, Optional, Union, LiteralString
 
 from loguru import logger
 
 from utils.json_sanitizer import JSONSanitizer
 
+# Characters stripped from the start of a bulleted list line
+_BULLET_CHARS = "-*•\t "
+
+# Markdown code block wrapping a JSON payload
+_JSON_CODE_BLOCK_RE = re.compile(r"```(?:json)?\n([\s\S]*?)\n```")
+
+# Markdown fenced code block: opening ``` line with optional language, body, closing ``` line
+_FENCED_CODE_RE = re.compile(r'^```(?P<lang>[^\n]*)\n(?P<code>.*?)^```', re.MULTILINE | re.DOTALL)
+
 
 class BaseParser:
     """Base class for all parsers with common functionality"""
@@ -15,21 +24,56 @@ class BaseParser:
         cleaned_value = value.strip().title()
         return cleaned_value if cleaned_value in valid_values else default
 
+    @staticmethod
+    def compile_section(section_name: str, end_pattern: str = None) -> re.Pattern:
+        """
+        Compile the pattern extract_section uses, for parsers that extract the same section repeatedly.
+
+        The whitespace after the colon is matched possessively (Python 3.11+) so a missing end
+        marker cannot make the lazy body retry once per leading whitespace character. Without an
+        end pattern the section is a single line, matched greedily with a negated class instead of
+        a lazy DOTALL body that tests a lookahead at every character.
+        """
+        if not end_pattern:
+            return re.compile(fr"{section_name}:\s*+([^\n]+)")
+        return re.compile(fr"{section_name}:\s*+(.+?)(?={end_pattern})", re.DOTALL)
+
+    @staticmethod
+    def search_section(pattern: re.Pattern, content: str) -> Optional[str]:
+        """Extract a section from content using a pattern built by compile_section"""
+        match = pattern.search(content)
+        return match.group(1).strip() if match else None
+
     @staticmethod
     def extract_section(content: str, section_name: str, end_pattern: str = None) -> Optional[str]:
         """Extract a section from content using regex"""
         try:
-            # Use raw string for the pattern and handle the end pattern separately
-            base_pattern = fr"{section_name}:\s*(.+?)"
-            end = fr"(?={end_pattern})" if end_pattern else r"(?=\n|$)"
-            pattern = base_pattern + end
-
-            match = re.search(pattern, content, re.DOTALL)
-            return match.group(1).strip() if match else None
+            pattern = BaseParser.compile_section(section_name, end_pattern)
+            return BaseParser.search_section(pattern, content)
         except Exception as e:
             logger.error(f"Error extracting section {section_name}: {str(e)}")
             return None
 
+    @staticmethod
+    def _is_json_object(item: Any, label: str) -> bool:
+        """Check that a parsed item is a JSON object, logging an error naming the item if not"""
+        if isinstance(item, dict):
+            return True
+        logger.error(f"{label} must be a JSON object, got {type(item).__name__}")
+        return False
+
+    @staticmethod
+    def _preview(text: str, limit: int = 500) -> str:
+        """Bound text for log messages, noting how much was left out"""
+        if not text or len(text) <= limit:
+            return text
+        return f"{text[:limit]}... [{len(text) - limit} more characters]"
+
+    @staticmethod
+    def _clean_bullet(line: str) -> Optional[str]:
+        """Strip surrounding whitespace and leading bullet markers from a line, None if nothing is left"""
+        return line.strip().lstrip(_BULLET_CHARS) or None
+
     @staticmethod
     def extract_list_items(content: str) -> List[str]:
         """Extract list items from content, handling various formats"""
@@ -37,23 +81,54 @@ class BaseParser:
         if not content:
             return items
 
-        for line in content.split('\n'):
+        for line in content.splitlines():
             line = line.strip()
+            if not line:
+                continue
+            # The line is already stripped, so only the text after the marker needs trimming
             if line.startswith(("- ", "* ", "• ")):
-                items.append(line[2:].strip())
+                items.append(line[2:].lstrip())
             elif line[0].isdigit() and ". " in line:
-                items.append(line.split(". ", 1)[1].strip())
-            elif line:
+                items.append(line.partition(". ")[2].lstrip())
+            else:
                 items.append(line)
         return items
 
+    @staticmethod
+    def _iter_tagged(content: str, tag_name: str, include_tags: bool = False) -> Iterator[str]:
+        """
+        Yield the content of each <tag_name>...</tag_name> block in order.
+
+        Uses plain substring search rather than a lazy DOTALL regex so the scan
+        stays linear on long LLM responses.
+
+        Args:
+            content: The text to scan
+            tag_name: Name of the XML-style tag
+            include_tags: Whether to keep the opening/closing tags in each yielded block
+
+        Yields:
+            The text of each complete block, without the tags unless include_tags is set
+        """
+        open_tag = f"<{tag_name}>"
+        close_tag = f"</{tag_name}>"
+        start = content.find(open_tag)
+        while start != -1:
+            body_start = start + len(open_tag)
+            end = content.find(close_tag, body_start)
+            if end == -1:
+                return
+            if include_tags:
+                yield content[start:end + len(close_tag)]
+            else:
+                yield content[body_start:end]
+            start = content.find(open_tag, end + len(close_tag))
+
     @staticmethod
     def extract_between_tags(content: str, tag_name: str) -> Optional[str]:
         """Extract content between XML-style tags"""
         try:
-            pattern = fr"<{tag_name}>(.*?)</{tag_name}>"
-            match = re.search(pattern, content, re.DOTALL)
-            return match.group(1) if match else None
+            return next(BaseParser._iter_tagged(content, tag_name), None)
         except Exception as e:
             logger.error(f"Error extracting content between {tag_name} tags: {str(e)}")
             return None
@@ -70,8 +145,7 @@ class BaseParser:
         """Extract JSON content from Markdown code blocks if present"""
         try:
             # Try to find JSON in code block
-            code_block_pattern = r"```(?:json)?\n([\s\S]*?)\n```"
-            match = re.search(code_block_pattern, content)
+            match = _JSON_CODE_BLOCK_RE.search(content)
 
             if match:
                 # Found JSON in code block, extract and clean it
@@ -129,14 +203,14 @@ class BaseParser:
             # Remove any Markdown code block markers
             json_content = json_content.replace('```json', '').replace('```', '').strip()
 
-            logger.debug(f"Attempting to parse JSON content: {json_content}")
+            logger.debug("Attempting to parse JSON content: {}", json_content)
 
             # Use the sanitizer to parse the content
             return JSONSanitizer.safe_parse_with_fallback(json_content)
 
         except Exception as e:
             logger.error(f"Failed to parse JSON content: {str(e)}")
-            logger.debug(f"Original content: {content}")
+            logger.debug("Original content: {}", content)
             return None
 
     @staticmethod
@@ -151,29 +225,14 @@ class BaseParser:
             List of dictionaries containing language and code
         """
         try:
-            # Find all code blocks with or without language specifiers
-            code_blocks = []
-            lines = content.split('\n')
-            current_block = None
-
-            for line in lines:
-                if line.startswith('```'):
-                    if current_block is None:
-                        # Start of a new code block
-                        lang = line[3:].strip()
-                        current_block = {
-                            'language': lang if lang else 'text',
-                            'code': []
-                        }
-                    else:
-                        # End of current code block
-                        current_block['code'] = '\n'.join(current_block['code'])
-                        code_blocks.append(current_block)
-                        current_block = None
-                elif current_block is not None:
-                    current_block['code'].append(line)
-
-            return code_blocks
+            # One pass over the content; fences must start at the beginning of a line
+            return [
+                {
+                    'language': match.group('lang').strip() or 'text',
+                    'code': match.group('code').removesuffix('\n')
+                }
+                for match in _FENCED_CODE_RE.finditer(content)
+            ]
 
         except Exception as e:
             logger.error(f"Failed to extract code blocks: {str(e)}")
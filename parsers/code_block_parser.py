@@ -38,11 +38,11 @@ class CodeBlockParser(BaseParser):
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
-            logger.error(f"Raw response:\n{content}")
+            logger.error("Raw response:\n{}", cls._preview(content))
             return cls._create_fallback_block(content)
         except Exception as e:
             logger.error(f"Failed to parse code blocks: {str(e)}")
-            logger.error(f"Content that caused error:\n{content}")
+            logger.error("Content that caused error:\n{}", cls._preview(content))
             return cls._create_fallback_block(content)
 
     @staticmethod
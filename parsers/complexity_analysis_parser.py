@@ -1,7 +1,23 @@
+import re
 from typing import Dict, Any, List
 
 from .base_parser import BaseParser
 
+# Free-text section headers, matched case-insensitively anywhere in a line
+_SECTION_HEADER_RE = re.compile(
+    r'(analysis|story points|complexity(?: level)?|effort estimate|technical factors|risk factors):',
+    re.IGNORECASE
+)
+_SECTION_FIELDS = {
+    "analysis": "analysis",
+    "story points": "story_points",
+    "complexity": "complexity_level",
+    "complexity level": "complexity_level",
+    "effort estimate": "effort_estimate",
+    "technical factors": "technical_factors",
+    "risk factors": "risk_factors"
+}
+
 
 class ComplexityAnalysisParser(BaseParser):
     """Parser for complexity analysis responses from LLM"""
@@ -57,7 +73,7 @@ class ComplexityAnalysisParser(BaseParser):
     @classmethod
     def _extract_structured_data(cls, text: str) -> Dict[str, Any]:
         """Extract structured data from text when JSON parsing fails"""
-        lines = text.split("\n")
+        lines = text.splitlines()
         data: Dict[str, Any] = {
             "analysis": "",
             "story_points": 0,
@@ -73,34 +89,35 @@ class ComplexityAnalysisParser(BaseParser):
             if not line:
                 continue
 
-            # Try to identify sections
-            lower_line = line.lower()
-            if "analysis:" in lower_line:
+            # Identify the section header (if any). Canonical "Header: value" lines resolve with a
+            # single dict lookup; the regex only runs for headers embedded further into the line
+            section = None
+            if ":" in line:
+                header_text, _, value = line.partition(":")
+                section = _SECTION_FIELDS.get(header_text.strip().lower())
+                if section is None:
+                    header = _SECTION_HEADER_RE.search(line)
+                    section = _SECTION_FIELDS[header.group(1).lower()] if header else None
+                value = value.strip()
+
+            if section == "analysis":
                 current_section = "analysis"
-                data["analysis"] = line.split(":", 1)[1].strip()
-            elif "story points:" in lower_line:
-                try:
-                    points = int(line.split(":", 1)[1].strip())
-                    data["story_points"] = points
-                except (ValueError, IndexError):
-                    pass
-            elif "complexity:" in lower_line or "complexity level:" in lower_line:
-                level = line.split(":", 1)[1].strip()
-                if any(valid in level for valid in ["Low", "Medium", "High"]):
-                    data["complexity_level"] = next(
-                        valid for valid in ["Low", "Medium", "High"]
-                        if valid in level
-                    )
-            elif "effort estimate:" in lower_line:
-                data["effort_estimate"] = line.split(":", 1)[1].strip()
-            elif "technical factors:" in lower_line:
-                current_section = "technical_factors"
-            elif "risk factors:" in lower_line:
-                current_section = "risk_factors"
+                data["analysis"] = value
+            elif section == "story_points":
+                if value.isascii() and value.isdigit():
+                    data["story_points"] = int(value)
+            elif section == "complexity_level":
+                level = next((valid for valid in ("Low", "Medium", "High") if valid in value), None)
+                if level:
+                    data["complexity_level"] = level
+            elif section == "effort_estimate":
+                data["effort_estimate"] = value
+            elif section in ("technical_factors", "risk_factors"):
+                current_section = section
             elif current_section in ["technical_factors", "risk_factors"]:
                 # Add bullet points to respective lists
                 if line.startswith(("-", "*", "•")):
-                    item = line.lstrip("-*• ").strip()
+                    item = cls._clean_bullet(line)
                     if item:
                         data[current_section].append(item)
 
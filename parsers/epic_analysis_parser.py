@@ -86,13 +86,11 @@ class EpicAnalysisParser(BaseParser):
                     if section_key == "main_objective":
                         sections[section_key] = section_content.strip()
                     else:
-                        # Extract list items, removing empty lines and list markers
-                        items = [
-                            item.strip().lstrip("- ").lstrip("* ").lstrip("• ")
-                            for item in section_content.split("\n")
-                            if item.strip() and not item.strip().startswith(("<", ">"))
+                        # Extract list items, removing empty lines, list markers and lines that open with a tag
+                        sections[section_key] = [
+                            item for line in section_content.splitlines()
+                            if not line.strip().startswith(("<", ">")) and (item := cls._clean_bullet(line))
                         ]
-                        sections[section_key] = [item for item in items if item]
 
             # Parse summary section if present
             summary = cls.extract_between_tags(text, "summary")
@@ -103,7 +101,7 @@ class EpicAnalysisParser(BaseParser):
 
         except Exception as e:
             logger.error(f"Error parsing epic analysis: {str(e)}")
-            logger.error(f"Text that caused error:\n{text}")
+            logger.error("Text that caused error:\n{}", cls._preview(text))
             return {
                 "main_objective": "Error parsing epic analysis",
                 "stakeholders": [],
@@ -44,11 +44,11 @@ class GherkinParser(BaseParser):
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
-            logger.error(f"Raw response:\n{content}")
+            logger.error("Raw response:\n{}", cls._preview(content))
             return []
         except Exception as e:
             logger.error(f"Failed to parse Gherkin scenarios: {str(e)}")
-            logger.error(f"Content that caused error:\n{content}")
+            logger.error("Content that caused error:\n{}", cls._preview(content))
             return []
 
     @staticmethod
@@ -1,3 +1,4 @@
+import functools
 import re
 from typing import Dict, Any, List
 
@@ -7,6 +8,24 @@ from models.sub_task import SubTask
 from utils.json_sanitizer import JSONSanitizer
 from .base_parser import BaseParser
 
+# Code bodies use the unrolled-loop form: runs of [^<] plus any '<' that does not start '</code>'.
+# This matches the same text as a lazy DOTALL body without retrying the terminator at every character.
+_CODE_BODY = r'([^<]*(?:<(?!/code>)[^<]*)*)'
+_CODE_LANGUAGE_RE = re.compile(r'<code\s+language=["\']([^"\']*)["\']>' + _CODE_BODY + r'</code>')
+_CODE_TAG_RE = re.compile(r'(<code[^>]*>)' + _CODE_BODY + r'(</code>)')
+_MARKDOWN_RE = re.compile(r'\*\*|__|`')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DIGITS_RE = re.compile(r'\d+', re.ASCII)
+_LIST_SEPARATOR_RE = re.compile(r'[,;]|\band\b')
+_NUMBERED_ITEM_RE = re.compile(r'\n\s*\d+\.\s+', re.ASCII)
+
+
+@functools.lru_cache(maxsize=64)
+def _xml_path_re(path: str) -> re.Pattern:
+    """Compile the pattern for an XML-like path such as 'parent/child' once per path"""
+    pattern = path.replace('/', '/.*?')
+    return re.compile(f"<{pattern}>(.*?)</{pattern.split('/')[-1]}>", re.DOTALL | re.IGNORECASE)
+
 
 class SubtaskParser(BaseParser):
     """Parser for subtasks"""
@@ -33,6 +52,10 @@ class SubtaskParser(BaseParser):
 
             subtasks = []
             for subtask_data in subtasks_data:
+                if not cls._is_json_object(subtask_data, "Subtask"):
+                    subtasks.append(cls._create_error_subtask("Invalid subtask format - expected JSON object"))
+                    continue
+
                 try:
                     # Create SubTask object from JSON data
                     subtask = SubTask(
@@ -60,14 +83,14 @@ class SubtaskParser(BaseParser):
 
                 except Exception as e:
                     logger.error(f"Failed to parse individual subtask: {str(e)}")
-                    logger.error(f"Subtask data:\n{subtask_data}")
+                    logger.error("Subtask data:\n{}", subtask_data)
                     subtasks.append(cls._create_error_subtask(str(e)))
 
             return subtasks if subtasks else [cls._create_error_subtask("No valid subtasks found")]
 
         except Exception as e:
             logger.error(f"Failed to parse subtasks: {str(e)}")
-            logger.error(f"Content:\n{content}")
+            logger.error("Content:\n{}", cls._preview(content))
             return [cls._create_error_subtask(str(e))]
 
     @staticmethod
@@ -101,28 +124,20 @@ class SubtaskParser(BaseParser):
     @classmethod
     def _extract_xml_content(cls, content: str, path: str, default: str = "") -> str:
         """Extract content from XML-like structure using regex"""
-        # Convert path to regex pattern
-        pattern = path.replace('/', '/.*?')
-        regex = f"<{pattern}>(.*?)</{pattern.split('/')[-1]}>"
-        match = re.search(regex, content, re.DOTALL | re.IGNORECASE)
+        match = _xml_path_re(path).search(content)
         return cls._clean_text(match.group(1)) if match else default
 
     @classmethod
     def _extract_xml_list(cls, content: str, path: str) -> List[str]:
         """Extract list of items from XML-like structure"""
-        pattern = path.replace('/', '/.*?')
-        regex = f"<{pattern}>(.*?)</{pattern.split('/')[-1]}>"
-        matches = re.finditer(regex, content, re.DOTALL | re.IGNORECASE)
+        matches = _xml_path_re(path).finditer(content)
         return [cls._clean_text(m.group(1)) for m in matches if m.group(1).strip()]
 
     @classmethod
     def _extract_code_blocks(cls, content: str) -> List[Dict[str, str]]:
         """Extract code blocks with their language"""
         blocks = []
-        pattern = r'<code\s+language=["\']([^"\']*)["\']>(.*?)</code>'
-        matches = re.finditer(pattern, content, re.DOTALL)
-
-        for match in matches:
+        for match in _CODE_LANGUAGE_RE.finditer(content):
             language = match.group(1) or "text"
             code = cls._clean_text(match.group(2))
             if code:
@@ -138,7 +153,7 @@ class SubtaskParser(BaseParser):
         if not text:
             return text
         # Remove Markdown formatting
-        text = re.sub(r'\*\*|__|`', '', text)
+        text = _MARKDOWN_RE.sub('', text)
         # Normalize whitespace
         text = ' '.join(text.split())
         return text.strip()
@@ -147,7 +162,9 @@ class SubtaskParser(BaseParser):
     def _parse_story_points(cls, points_text: str) -> int:
         """Parse and validate story points"""
         try:
-            points = int(re.search(r'\d+', points_text).group())
+            # Plain numbers skip the regex; only free text like "about 5 points" needs a search
+            stripped = points_text.strip()
+            points = int(stripped) if stripped.isascii() and stripped.isdigit() else int(_DIGITS_RE.search(points_text).group())
             valid_points = [1, 2, 3, 5, 8, 13]
             return min(valid_points, key=lambda x: abs(x - points))
         except (ValueError, AttributeError):
@@ -159,12 +176,12 @@ class SubtaskParser(BaseParser):
         # Normalize newlines
         content = content.replace('\r\n', '\n')
         # Preserve newlines in code blocks
-        code_blocks = re.finditer(r'(<code[^>]*>)(.*?)(</code>)', content, re.DOTALL)
-        for block in code_blocks:
-            preserved = block.group(2).replace('\n', '{{NEWLINE}}')
-            content = content.replace(block.group(0), f'{block.group(1)}{preserved}{block.group(3)}')
+        content = _CODE_TAG_RE.sub(
+            lambda block: block.group(1) + block.group(2).replace('\n', '{{NEWLINE}}') + block.group(3),
+            content
+        )
         # Clean up general whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
         # Restore newlines in code blocks
         content = content.replace('{{NEWLINE}}', '\n')
         return content.strip()
@@ -175,28 +192,26 @@ class SubtaskParser(BaseParser):
         if not text:
             return []
 
-        # Split by common separators and clean up
-        items = [
-            cls._clean_text(item.strip())
-            for item in re.split(r'[,;]|\band\b', text)
-            if item.strip() and item.strip().lower() not in ['none', 'n/a', '-']
+        # Split by common separators and clean up, stripping each item once
+        return [
+            cls._clean_text(stripped)
+            for item in _LIST_SEPARATOR_RE.split(text)
+            if (stripped := item.strip()) and stripped.lower() not in ('none', 'n/a', '-')
         ]
 
-        return items
-
     @classmethod
     def _split_into_subtasks(cls, content: str) -> List[str]:
         """Split content into individual subtask blocks"""
         # Try to split by <subtask> tags first
-        subtasks = re.findall(r'<subtask>.*?</subtask>', content, re.DOTALL)
+        subtasks = list(cls._iter_tagged(content, "subtask", include_tags=True))
         if subtasks:
             return subtasks
 
         # If no <subtask> tags found, try to split by numbered items
-        subtasks = re.split(r'\n\s*\d+\.\s+', content)
+        subtasks = _NUMBERED_ITEM_RE.split(content)
         if len(subtasks) > 1:
             # Remove empty or whitespace-only items
-            return [s.strip() for s in subtasks[1:] if s.strip()]
+            return [stripped for s in subtasks[1:] if (stripped := s.strip())]
 
         # If no clear separation found, treat as single subtask
         return [content] if content.strip() else []
@@ -36,7 +36,7 @@ class TechnicalTaskParser(BaseParser):
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
-            logger.error(f"Raw response:\n{response}")
+            logger.error("Raw response:\n{}", cls._preview(response))
             return []
         except Exception as e:
             logger.error(f"Failed to parse technical tasks from response: {str(e)}")
@@ -46,6 +46,9 @@ class TechnicalTaskParser(BaseParser):
     def _validate_task(cls, task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Validate and clean up a technical task"""
         try:
+            if not cls._is_json_object(task, "Technical task"):
+                return None
+
             # Validate required fields
             required_fields = [
                 "title", "description", "technical_domain",
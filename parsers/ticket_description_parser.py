@@ -1,4 +1,5 @@
 import re
+import sys
 from typing import Dict, Any, List
 
 from loguru import logger
@@ -7,6 +8,23 @@ from models.ticket_description import TicketDescription
 from models.gherkin import GherkinScenario, GherkinStep
 from .base_parser import BaseParser
 
+# Gherkin tokens: a scenario header (possibly unnamed) or a step at the start of a line, each running to the end of it;
+# the line may open with a bullet or list number, and the scenario label may be bold
+_GHERKIN_TOKEN_RE = re.compile(
+    r'^[ \t]*(?:[-*•]|\d+\.)?[ \t]*(?:(?P<scenario>(?:\*\*)?Scenario:(?:\*\*)?[ \t]*(?P<name>.*))|(?P<keyword>Given|When|Then|And)[ \t]+(?P<text>.+))',
+    re.MULTILINE
+)
+
+# Ticket field headers at the start of a line, optionally bulleted or bold; a field's text runs until the next header
+_TICKET_HEADER_RE = re.compile(
+    r'^[ \t]*(?P<bullet>[-*•][ \t]+)?(?:\*\*)?(?P<name>Title|Description|Technical Domain|Required Skills|Story Points|'
+    r'Suggested Assignee|Complexity|Acceptance Criteria|Scenarios|Technical Notes)(?:\*\*)?:(?:\*\*)?[ \t]*',
+    re.MULTILINE
+)
+_SINGLE_LINE_FIELDS = frozenset({
+    "Title", "Technical Domain", "Required Skills", "Story Points", "Suggested Assignee", "Complexity"
+})
+
 
 class TicketDescriptionParser(BaseParser):
     """Parser for ticket descriptions from LLM responses"""
@@ -22,33 +40,38 @@ class TicketDescriptionParser(BaseParser):
             if not content:
                 raise ValueError("No ticket content found between <ticket> tags")
 
+            # Split the ticket into its fields in a single pass over the header lines
+            fields = cls._split_fields(content)
+
             # Extract fields
-            title = cls.extract_section(content, "Title") or ""
-            description = cls.extract_section(content, "Description", r"\nTechnical Domain:") or ""
-            technical_domain = cls.extract_section(content, "Technical Domain") or ""
-            
+            title = fields.get("Title", "")
+            description = fields.get("Description", "")
+            technical_domain = fields.get("Technical Domain", "")
+
             # Extract skills
-            skills_text = cls.extract_section(content, "Required Skills")
-            required_skills = [s.strip() for s in skills_text.split(",")] if skills_text else []
+            skills_text = fields.get("Required Skills")
+            required_skills = [
+                skill for s in skills_text.split(",") if (skill := s.strip())
+            ] if skills_text else []
 
             # Extract story points
-            points_text = cls.extract_section(content, "Story Points")
+            points_text = fields.get("Story Points")
             story_points = int(points_text) if points_text and points_text.isdigit() else 0
 
             # Extract other fields
-            suggested_assignee = cls.extract_section(content, "Suggested Assignee") or ""
-            complexity = cls.extract_section(content, "Complexity") or ""
+            suggested_assignee = fields.get("Suggested Assignee", "")
+            complexity = sys.intern(fields.get("Complexity", ""))
 
             # Extract acceptance criteria
-            ac_text = cls.extract_section(content, "Acceptance Criteria", r"\nScenarios:")
+            ac_text = fields.get("Acceptance Criteria")
             acceptance_criteria = cls.extract_list_items(ac_text) if ac_text else []
 
             # Extract scenarios
-            scenarios_text = cls.extract_section(content, "Scenarios", r"\nTechnical Notes:")
+            scenarios_text = fields.get("Scenarios")
             scenarios = cls._parse_scenarios(scenarios_text) if scenarios_text else []
 
             # Extract technical notes
-            technical_notes = cls.extract_section(content, "Technical Notes", r"\n</ticket>") or ""
+            technical_notes = fields.get("Technical Notes", "")
 
             # Create and return TicketDescription model
             ticket = TicketDescription(
@@ -69,33 +92,48 @@ class TicketDescriptionParser(BaseParser):
 
         except Exception as e:
             logger.error(f"Error parsing ticket description: {str(e)}")
-            logger.error(f"Response text:\n{response_text}")
+            logger.error("Response text:\n{}", cls._preview(response_text))
             raise
 
-    @classmethod
-    def _parse_scenarios(cls, scenarios_text: str) -> List[GherkinScenario]:
-        """Parse Gherkin scenarios from text"""
-        scenarios = []
-        scenario_blocks = re.finditer(r'Scenario:.*?(?=Scenario:|$)', scenarios_text, re.DOTALL)
+    @staticmethod
+    def _split_fields(content: str) -> Dict[str, str]:
+        """Map each field header to its text; single-line fields keep only their first line"""
+        fields = {}
+        headers = []
+        for header in _TICKET_HEADER_RE.finditer(content):
+            # Inside a multi-line field a bulleted "Name:" line is a list item, not the next header
+            if header.group("bullet") and headers and headers[-1].group("name") not in _SINGLE_LINE_FIELDS:
+                continue
+            headers.append(header)
 
-        for block in scenario_blocks:
-            # Get scenario name
-            name_match = re.search(r'Scenario:\s*(.+?)(?=\n|$)', block.group(0))
-            if not name_match:
+        for index, header in enumerate(headers):
+            name = header.group("name")
+            if name in fields:
                 continue
 
-            # Get steps
-            steps = re.findall(r'(Given|When|Then|And)\s+(.+?)(?=\n|$)', block.group(0))
-            gherkin_steps = [
-                GherkinStep(keyword=keyword, text=text.strip())
-                for keyword, text in steps
-            ]
-
-            # Create scenario model
-            scenario = GherkinScenario(
-                name=name_match.group(1).strip(),
-                steps=gherkin_steps
-            )
-            scenarios.append(scenario)
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(content)
+            value = content[header.end():end].strip()
+            if name in _SINGLE_LINE_FIELDS:
+                value = value.partition("\n")[0].strip()
+            fields[name] = value
+
+        return fields
+
+    @classmethod
+    def _parse_scenarios(cls, scenarios_text: str) -> List[GherkinScenario]:
+        """Parse Gherkin scenarios from text in a single pass over scenario and step tokens"""
+        scenarios = []
+        current = None
+
+        for token in _GHERKIN_TOKEN_RE.finditer(scenarios_text):
+            if token.group("scenario"):
+                current = GherkinScenario(name=token.group("name").strip(), steps=[])
+                scenarios.append(current)
+            elif current is not None:
+                # Steps before the first scenario header have no scenario to belong to
+                # Keywords come from a four-word vocabulary, so interning shares one string per keyword
+                current.steps.append(
+                    GherkinStep(keyword=sys.intern(token.group("keyword")), text=token.group("text").strip())
+                )
 
         return scenarios
@@ -38,7 +38,7 @@ class UserStoryParser(BaseParser):
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
-            logger.error(f"Raw response:\n{response}")
+            logger.error("Raw response:\n{}", cls._preview(response))
             return [cls._create_error_story(f"Failed to parse JSON response: {str(e)}")]
         except Exception as e:
             logger.error(f"Failed to parse user stories from response: {str(e)}")
@@ -48,6 +48,9 @@ class UserStoryParser(BaseParser):
     def _validate_story(cls, story: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Validate and clean up a user story"""
         try:
+            if not cls._is_json_object(story, "User story"):
+                return None
+
             # Validate required fields
             required_fields = ["title", "description", "technical_domain"]
             if not all(field in story for field in required_fields):
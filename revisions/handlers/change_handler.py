@@ -58,5 +58,5 @@ class ChangeHandler:
 
         except Exception as e:
             logger.error(f"Failed to apply changes: {str(e)}")
-            logger.error(f"Changes: {json.dumps(changes, cls=DateTimeEncoder)}")
+            logger.opt(lazy=True).error("Changes: {}", lambda: json.dumps(changes, cls=DateTimeEncoder))
             raise
@@ -84,5 +84,5 @@ class TicketHandler:
 
         except Exception as e:
             logger.error(f"Failed to update ticket: {str(e)}")
-            logger.error(f"Update data: {json.dumps(update_data, cls=DateTimeEncoder)}")
+            logger.opt(lazy=True).error("Update data: {}", lambda: json.dumps(update_data, cls=DateTimeEncoder))
             raise
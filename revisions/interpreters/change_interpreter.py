@@ -1,7 +1,7 @@
 import json
 import re
 import xml.etree.ElementTree as ET
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from io import StringIO
 
 from loguru import logger
@@ -10,49 +10,45 @@ from .base_interpreter import BaseInterpreter
 from ..models import DateTimeEncoder
 
 
+def _tag_body(tag: str) -> str:
+    """Unrolled-loop body matching up to the first closing tag without a lazy DOTALL scan"""
+    return fr'([^<]*(?:<(?!/{tag}>)[^<]*)*)'
+
+
+_CHANGES_RE = re.compile(r'<changes>' + _tag_body('changes') + r'</changes>')
+_FIELD_UPDATES_RE = re.compile(r'<field_updates>' + _tag_body('field_updates') + r'</field_updates>')
+_LIST_APPEND_RE = re.compile(r'<list_append>' + _tag_body('list_append') + r'</list_append>')
+_LIST_REMOVE_RE = re.compile(r'<list_remove>' + _tag_body('list_remove') + r'</list_remove>')
+_FIELD_RE = re.compile(r'<field\s+name="([^"]+)">' + _tag_body('field') + r'</field>')
+_ITEM_RE = re.compile(r'<item>' + _tag_body('item') + r'</item>')
+
+
 class ChangeInterpreter(BaseInterpreter):
     """Interpreter for generating specific changes to apply"""
 
+    @staticmethod
+    def _section_fields(section_pattern: re.Pattern, xml_content: str) -> Iterator[re.Match]:
+        """Yield the <field> matches inside the first section matched by section_pattern, if any"""
+        section = section_pattern.search(xml_content)
+        return _FIELD_RE.finditer(section.group(1)) if section else iter(())
+
     def _fallback_regex_extraction(self, xml_content: str) -> Dict[str, Any]:
         """Fallback method to extract changes using regex when XML parsing fails"""
         logger.info("Attempting fallback regex extraction")
         result = {"field_updates": {}, "list_append": {}, "list_remove": {}}
         
         # Extract field updates using regex
-        field_updates_match = re.search(r'<field_updates>(.*?)</field_updates>', xml_content, re.DOTALL)
-        if field_updates_match:
-            field_updates_content = field_updates_match.group(1)
-            field_patterns = re.finditer(r'<field\s+name="([^"]+)">(.*?)</field>', field_updates_content, re.DOTALL)
-            for match in field_patterns:
-                field_name = match.group(1)
-                field_value = match.group(2).strip()
-                result["field_updates"][field_name] = field_value
-        
-        # Extract list appends using regex
-        list_append_match = re.search(r'<list_append>(.*?)</list_append>', xml_content, re.DOTALL)
-        if list_append_match:
-            list_append_content = list_append_match.group(1)
-            field_patterns = re.finditer(r'<field\s+name="([^"]+)">(.*?)</field>', list_append_content, re.DOTALL)
-            for match in field_patterns:
-                field_name = match.group(1)
-                field_content = match.group(2)
-                items = re.findall(r'<item>(.*?)</item>', field_content, re.DOTALL)
-                if items:
-                    result["list_append"][field_name] = [item.strip() for item in items]
-        
-        # Extract list removes using regex
-        list_remove_match = re.search(r'<list_remove>(.*?)</list_remove>', xml_content, re.DOTALL)
-        if list_remove_match:
-            list_remove_content = list_remove_match.group(1)
-            field_patterns = re.finditer(r'<field\s+name="([^"]+)">(.*?)</field>', list_remove_content, re.DOTALL)
-            for match in field_patterns:
-                field_name = match.group(1)
-                field_content = match.group(2)
-                items = re.findall(r'<item>(.*?)</item>', field_content, re.DOTALL)
+        for match in self._section_fields(_FIELD_UPDATES_RE, xml_content):
+            result["field_updates"][match.group(1)] = match.group(2).strip()
+
+        # Extract list appends and removes using regex
+        for operation, pattern in (("list_append", _LIST_APPEND_RE), ("list_remove", _LIST_REMOVE_RE)):
+            for match in self._section_fields(pattern, xml_content):
+                items = _ITEM_RE.findall(match.group(2))
                 if items:
-                    result["list_remove"][field_name] = [item.strip() for item in items]
+                    result[operation][match.group(1)] = [item.strip() for item in items]
         
-        logger.info(f"Regex fallback extracted: {result}")
+        logger.info("Regex fallback extracted: {}", result)
         return result
 
     async def generate_changes(
@@ -132,7 +128,7 @@ class ChangeInterpreter(BaseInterpreter):
             response = await self.generate_interpretation(prompt)
 
             # Extract the XML from the response
-            changes_match = re.search(r'<changes>.*?</changes>', response, re.DOTALL)
+            changes_match = _CHANGES_RE.search(response)
             if not changes_match:
                 logger.error(f"No valid XML changes found in response")
                 return {"field_updates": {}, "list_append": {}, "list_remove": {}}
@@ -200,6 +196,6 @@ class ChangeInterpreter(BaseInterpreter):
 
         except Exception as e:
             logger.error(f"Failed to generate changes: {str(e)}")
-            logger.error(f"Ticket data: {json.dumps(ticket_data, cls=DateTimeEncoder)}")
+            logger.opt(lazy=True).error("Ticket data: {}", lambda: json.dumps(ticket_data, cls=DateTimeEncoder))
             logger.error(f"Interpreted changes: {interpreted_changes}")
             raise
@@ -49,6 +49,6 @@ class TicketInterpreter(BaseInterpreter):
 
         except Exception as e:
             logger.error(f"Failed to interpret ticket revision request: {str(e)}")
-            logger.error(f"Ticket data: {json.dumps(ticket_data, cls=DateTimeEncoder)}")
+            logger.opt(lazy=True).error("Ticket data: {}", lambda: json.dumps(ticket_data, cls=DateTimeEncoder))
             logger.error(f"Revision request: {revision_request}")
             raise
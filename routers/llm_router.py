@@ -65,7 +65,7 @@ async def break_down_epic(epic_key: str) -> JiraEpicBreakdownResult:
         execution_manager = ExecutionManager(epic_key)
         response_formatter = ResponseFormatterService()
         result = await execution_manager.execute_breakdown()
-        logger.info(f"Breakdown result: {result}")
+        logger.info("Breakdown result: {}", result)
         return response_formatter.format_epic_breakdown(result)
 
     except Exception as e:
@@ -181,7 +181,7 @@ async def request_plan_revision(
     """Request a revision to a ticket"""
     try:
         logger.info(f"Received revision request for execution: {execution_id}, ticket: {ticket_id}")
-        logger.debug(f"Request data: {request.model_dump()}")
+        logger.opt(lazy=True).debug("Request data: {}", request.model_dump)
 
         # Validate the request has content
         if not request.revision_request.strip():
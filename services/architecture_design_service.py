@@ -28,6 +28,8 @@ from llm.vertexllm import VertexLLM
 from llm.genaillm import GenAILLM
 from services.mongodb_service import MongoDBService
 
+_MERMAID_BLOCK_RE = re.compile(r"```mermaid\s*([\s\S]*?)```")
+
 class ArchitectureDesignService:
     """
     Service for generating architecture designs for JIRA epics.
@@ -263,12 +265,13 @@ class ArchitectureDesignService:
         
         # Parse the analysis to determine which diagrams to generate
         diagram_types = []
-        for line in analysis_response.strip().split('\n'):
-            if ':' in line and any(dt in line.lower() for dt in DIAGRAM_TEMPLATES.keys()):
-                for diagram_type in DIAGRAM_TEMPLATES.keys():
-                    if diagram_type in line.lower():
-                        diagram_types.append(diagram_type)
-                        break
+        for line in analysis_response.splitlines():
+            if ':' not in line:
+                continue
+            lower_line = line.lower()
+            diagram_type = next((dt for dt in DIAGRAM_TEMPLATES if dt in lower_line), None)
+            if diagram_type:
+                diagram_types.append(diagram_type)
         
         # Generate up to 3 diagram types
         diagram_types = list(set(diagram_types))[:3]  # Remove duplicates and limit to 3
@@ -425,22 +428,21 @@ class ArchitectureDesignService:
             DiagramInfo object or None if no diagram found
         """
         # Find sections between ```mermaid and ```
-        pattern = r"```mermaid\s*([\s\S]*?)```"
-        matches = re.findall(pattern, text)
+        match = _MERMAID_BLOCK_RE.search(text)
         
-        if not matches:
+        if not match:
             logger.warning(f"No mermaid diagram found in the {diagram_type} response")
             return None
             
         # Use the first diagram found
-        mermaid_code = matches[0].strip()
+        mermaid_code = match.group(1).strip()
         
         # Extract title from the text before/after the diagram
         title = f"{diagram_type.capitalize()} Diagram"
         description = ""
         
         # Look for titles and descriptions in the text
-        lines = text.split("\n")
+        lines = text.splitlines()
         for i, line in enumerate(lines):
             if "```mermaid" in line and i > 0:
                 # Check if the previous line is a heading
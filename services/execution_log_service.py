@@ -96,10 +96,10 @@ class ExecutionLogService:
             logger.info("\nPrompt:")
             logger.info(f"{prompt}")
             logger.info("\nRaw Response:")
-            logger.info(f"{response}")
+            logger.info("{}", response)
             if parsed_result:
                 logger.info("\nParsed Result:")
-                logger.info(json.dumps(parsed_result, indent=2))
+                logger.opt(lazy=True).info("{}", lambda: json.dumps(parsed_result, indent=2))
 
             # Log to file
             with open(self.filename, "a") as f:
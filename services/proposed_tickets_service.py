@@ -203,7 +203,7 @@ class ProposedTicketsService:
                     allow_unicode=True
                 )
             logger.info(f"Saved proposed tickets to {self.filename}")
-            logger.debug(f"ID Summary: {self.get_id_summary()}")
+            logger.opt(lazy=True).debug("ID Summary: {}", self.get_id_summary)
         except Exception as e:
             logger.error(f"Failed to save proposed tickets: {str(e)}")
 
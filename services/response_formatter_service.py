@@ -33,7 +33,7 @@ class ResponseFormatterService:
             # Log the raw input for debugging
             try:
                 logger.debug("Raw input data:")
-                logger.debug(json.dumps(result, default=str))
+                logger.opt(lazy=True).debug("{}", lambda: json.dumps(result, default=str))
             except Exception as e:
                 logger.error(f"Failed to serialize raw input: {str(e)}")
                 logger.debug("Individual field inspection:")
@@ -51,7 +51,7 @@ class ResponseFormatterService:
             for task in result["tasks"]:
                 try:
                     # Log the task structure for debugging
-                    logger.debug(f"Processing task: {task}")
+                    logger.debug("Processing task: {}", task)
                     if not isinstance(task, dict):
                         logger.error(f"Task is not a dictionary: {type(task)}")
                         continue
@@ -72,23 +72,23 @@ class TaskTracker:
 
     def debug_state(self) -> str:
         """Get a detailed debug representation of current state"""
-        state = (
+        state = [
             f"TaskTracker State for {self.epic_key}:\n"
             f"User Stories ({len(self.user_stories)}):\n"
-        )
+        ]
 
         for story in self.user_stories:
-            state += f"- {story.get('title', story.get('name', 'Unnamed'))}\n"
+            state.append(f"- {story.get('title', story.get('name', 'Unnamed'))}\n")
 
-        state += f"\nTechnical Tasks ({len(self.technical_tasks)}):\n"
+        state.append(f"\nTechnical Tasks ({len(self.technical_tasks)}):\n")
         for task in self.technical_tasks:
-            state += f"- {task.get('title', task.get('name', 'Unnamed'))}\n"
+            state.append(f"- {task.get('title', task.get('name', 'Unnamed'))}\n")
 
-        state += f"\nSubtasks by Parent ({len(self.subtasks)}):\n"
+        state.append(f"\nSubtasks by Parent ({len(self.subtasks)}):\n")
         for parent, subtasks in self.subtasks.items():
-            state += f"- {parent}: {len(subtasks)} subtasks\n"
+            state.append(f"- {parent}: {len(subtasks)} subtasks\n")
 
-        return state
+        return "".join(state)
 
     def update_task_dependencies(self, task_title: str, resolved_dependencies: List[str]) -> None:
         """
@@ -2,38 +2,58 @@ from typing import Dict, Any
 
 from loguru import logger
 
+# Required fields and their types, built once instead of on every validation call
+_TASK_FIELDS = {
+    "type": str,
+    "name": str,
+    "description": str,
+    "technical_domain": str,
+    "complexity": str,
+    "dependencies": list
+}
+_TASK_TYPE_FIELDS = {
+    "User Story": {**_TASK_FIELDS, "business_value": str},
+    "Technical Task": {**_TASK_FIELDS, "implementation_notes": str}
+}
+_SUBTASK_FIELDS = {
+    "title": str,
+    "description": str,
+    "acceptance_criteria": str,
+    "story_points": int,
+    "required_skills": list,
+    "dependencies": list,
+    "suggested_assignee": str
+}
+
 
 class ValidationHelper:
     """Helper class for validating task structures and data"""
 
+    @staticmethod
+    def _validate_fields(data: Dict[str, Any], required_fields: Dict[str, type], label: str) -> bool:
+        """Check data against a field-to-type schema, logging the first problem found"""
+        # Valid records pass in a single all() check; the per-field walk only runs to report a failure
+        if all(field in data and isinstance(data[field], field_type)
+               for field, field_type in required_fields.items()):
+            return True
+
+        for field, field_type in required_fields.items():
+            if field not in data:
+                logger.error(f"Missing required field '{field}' in {label}")
+                return False
+            if not isinstance(data[field], field_type):
+                logger.error(
+                    f"Field '{field}' in {label} has wrong type. Expected {field_type}, got {type(data[field])}")
+                return False
+        return False
+
     @staticmethod
     def validate_task_structure(task: Dict[str, Any], task_type: str) -> bool:
         """Validate a high-level task has all required fields"""
-        required_fields = {
-            "type": str,
-            "name": str,
-            "description": str,
-            "technical_domain": str,
-            "complexity": str,
-            "dependencies": list
-        }
-
-        # Add type-specific required fields
-        if task_type == "User Story":
-            required_fields["business_value"] = str
-        elif task_type == "Technical Task":
-            required_fields["implementation_notes"] = str
+        required_fields = _TASK_TYPE_FIELDS.get(task_type, _TASK_FIELDS)
 
         try:
-            for field, field_type in required_fields.items():
-                if field not in task:
-                    logger.error(f"Missing required field '{field}' in {task_type}")
-                    return False
-                if not isinstance(task[field], field_type):
-                    logger.error(
-                        f"Field '{field}' in {task_type} has wrong type. Expected {field_type}, got {type(task[field])}")
-                    return False
-            return True
+            return ValidationHelper._validate_fields(task, required_fields, task_type)
         except Exception as e:
             logger.error(f"Error validating {task_type} structure: {str(e)}")
             return False
@@ -41,26 +61,8 @@ class ValidationHelper:
     @staticmethod
     def validate_subtask_structure(subtask: Dict[str, Any]) -> bool:
         """Validate a subtask has all required fields"""
-        required_fields = {
-            "title": str,
-            "description": str,
-            "acceptance_criteria": str,
-            "story_points": int,
-            "required_skills": list,
-            "dependencies": list,
-            "suggested_assignee": str
-        }
-
         try:
-            for field, field_type in required_fields.items():
-                if field not in subtask:
-                    logger.error(f"Missing required field '{field}' in subtask")
-                    return False
-                if not isinstance(subtask[field], field_type):
-                    logger.error(
-                        f"Field '{field}' in subtask has wrong type. Expected {field_type}, got {type(subtask[field])}")
-                    return False
-            return True
+            return ValidationHelper._validate_fields(subtask, _SUBTASK_FIELDS, "subtask")
         except Exception as e:
             logger.error(f"Error validating subtask structure: {str(e)}")
             return False
@@ -85,11 +87,10 @@ class ValidationHelper:
             if not ValidationHelper.validate_task_structure(task_group["high_level_task"], task_type):
                 return False
 
-            for subtask in task_group["subtasks"]:
-                if not ValidationHelper.validate_subtask_structure(subtask):
-                    return False
-
-            return True
+            # all() stops at the first invalid subtask, which has already logged why it failed
+            return all(
+                ValidationHelper.validate_subtask_structure(subtask) for subtask in task_group["subtasks"]
+            )
         except Exception as e:
             logger.error(f"Error validating task group: {str(e)}")
             return False
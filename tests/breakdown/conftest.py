@@ -0,0 +1,110 @@
+import pytest
+from typing import Any, Dict, List, Tuple
+from unittest.mock import Mock
+
+from models.implementation_notes import ImplementationNotes
+from models.story_description import StoryDescription
+from models.technical_task import ImplementationApproach, TechnicalTask
+from models.user_story import UserStory
+from services.task_tracker import TaskTracker
+
+
+# Field values for the test doubles built by make_user_story / make_technical_task. Each call
+# returns fresh lists and sub-models, which are passed to model_construct without Pydantic validation.
+def _user_story_defaults() -> Dict[str, Any]:
+    return {
+        "title": "Test Story",
+        "type": "User Story",
+        "description": StoryDescription(
+            role="developer",
+            goal="implement feature",
+            benefit="improve system",
+            formatted="As a developer, I want to implement feature, so that I can improve system"
+        ),
+        "technical_domain": "Domain 1",
+        "complexity": "Medium",
+        "business_value": "High",
+        "story_points": 3,
+        "required_skills": ["Skill1"],
+        "suggested_assignee": "Test Assignee",
+        "dependencies": [],
+        "acceptance_criteria": ["Criteria1"],
+        "implementation_notes": ImplementationNotes()
+    }
+
+
+def _technical_task_defaults() -> Dict[str, Any]:
+    return {
+        "id": "TT-1",
+        "title": "Test Technical Task",
+        "type": "Technical Task",
+        "description": "Test Description",
+        "technical_domain": "Test Domain",
+        "complexity": "Medium",
+        "business_value": "High",
+        "story_points": 3,
+        "required_skills": ["Skill1"],
+        "suggested_assignee": "Test Assignee",
+        "dependencies": [],
+        "acceptance_criteria": ["Test Criteria"],
+        "performance_impact": "Low impact",
+        "scalability_considerations": "Scales well",
+        "monitoring_needs": "Basic monitoring",
+        "testing_requirements": "Unit tests required",
+        "implementation_approach": ImplementationApproach(
+            approach="Test approach",
+            architecture="Test architecture",
+            data_flow="Test data flow",
+            security="Test security",
+            dependencies="Test dependencies"
+        )
+    }
+
+
+@pytest.fixture
+def mock_execution_log():
+    return Mock()
+
+
+@pytest.fixture
+def mock_task_tracker():
+    return Mock(spec_set=TaskTracker)
+
+
+@pytest.fixture
+def mock_proposed_tickets():
+    return Mock()
+
+
+@pytest.fixture
+def make_user_story():
+    """Build an unvalidated UserStory from the defaults, with optional field overrides"""
+    def _make_user_story(**overrides) -> UserStory:
+        return UserStory.model_construct(**{**_user_story_defaults(), **overrides})
+    return _make_user_story
+
+
+@pytest.fixture
+def make_technical_task():
+    """Build an unvalidated TechnicalTask from the defaults, with optional field overrides"""
+    def _make_technical_task(**overrides) -> TechnicalTask:
+        return TechnicalTask.model_construct(**{**_technical_task_defaults(), **overrides})
+    return _make_technical_task
+
+
+class FakeLLM:
+    """In-memory stand-in for VertexLLM that answers prompts from a canned response table and records each call"""
+
+    def __init__(self, default: str = '{"test": "response"}'):
+        self.default = default
+        self.responses: Dict[str, str] = {}
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def generate_content(self, prompt: str, **kwargs) -> str:
+        self.calls.append((prompt, kwargs))
+        return self.responses.get(prompt, self.default)
+
+
+@pytest.fixture
+def fake_llm():
+    return FakeLLM()
@@ -25,11 +25,6 @@ def mock_task_tracker():
     return tracker
 
 
-@pytest.fixture
-def mock_execution_log():
-    return Mock()
-
-
 def test_log_completion_summary_success(mock_task_tracker, mock_execution_log):
     # Act
     log_completion_summary(mock_task_tracker, mock_execution_log)
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock, DEFAULT
 
 from models.analysis_info import AnalysisInfo
 from models.complexity_analysis import ComplexityAnalysis
@@ -7,11 +7,6 @@ from models.ticket_description import TicketDescription
 from breakdown.epic_analyzer import EpicAnalyzer
 
 
-@pytest.fixture
-def mock_execution_log():
-    return Mock()
-
-
 @pytest.fixture
 def analyzer(mock_execution_log):
     analyzer = EpicAnalyzer(mock_execution_log)
@@ -20,38 +15,53 @@ def analyzer(mock_execution_log):
     return analyzer
 
 
+@pytest.fixture
+def llm_response(analyzer):
+    """Make the analyzer's LLM return a canned response"""
+    analyzer.llm.generate_content = AsyncMock(return_value="LLM Response")
+    return "LLM Response"
+
+
+@pytest.fixture
+def mock_parsers():
+    """Patch every parser EpicAnalyzer uses with a single patch.multiple"""
+    with patch.multiple(
+        'breakdown.epic_analyzer',
+        EpicAnalysisParser=DEFAULT,
+        ComplexityAnalysisParser=DEFAULT,
+        TicketDescriptionParser=DEFAULT
+    ) as parsers:
+        yield parsers
+
+
 @pytest.mark.asyncio
-async def test_analyze_epic_success(analyzer, mock_execution_log):
+async def test_analyze_epic_success(analyzer, llm_response, mock_parsers):
     # Arrange
     summary = "Test Epic"
     description = "Test Description"
-    mock_response = "LLM Response"
     mock_analysis_dict = {
         "main_objective": "Test Objective",
         "technical_domains": ["Domain1", "Domain2"],
         "core_requirements": ["Req1", "Req2"],
         "stakeholders": ["Stakeholder1"]
     }
-    
-    analyzer.llm.generate_content = AsyncMock(return_value=mock_response)
-    with patch('breakdown.epic_analyzer.EpicAnalysisParser') as mock_parser:
-        mock_parser.parse_with_format_fixing = AsyncMock(return_value=mock_analysis_dict)
-
-        # Act
-        result = await analyzer.analyze_epic(summary, description)
-
-        # Assert
-        assert isinstance(result, AnalysisInfo)
-        assert result.main_objective == "Test Objective"
-        assert result.technical_domains == ["Domain1", "Domain2"]
-        assert result.core_requirements == ["Req1", "Req2"]
-        assert result.stakeholders == ["Stakeholder1"]
-        
-        # Verify LLM was called with correct parameters
-        analyzer.llm.generate_content.assert_called_once()
-        assert analyzer.llm.generate_content.call_args[1]["temperature"] == 0.2
-        assert analyzer.llm.generate_content.call_args[1]["top_p"] == 0.8
-        assert analyzer.llm.generate_content.call_args[1]["top_k"] == 40
+    mock_parsers["EpicAnalysisParser"].parse_with_format_fixing = AsyncMock(return_value=mock_analysis_dict)
+
+    # Act
+    result = await analyzer.analyze_epic(summary, description)
+
+    # Assert
+    assert isinstance(result, AnalysisInfo)
+    assert result.main_objective == "Test Objective"
+    assert result.technical_domains == ["Domain1", "Domain2"]
+    assert result.core_requirements == ["Req1", "Req2"]
+    assert result.stakeholders == ["Stakeholder1"]
+
+    # Verify LLM was called with correct parameters
+    analyzer.llm.generate_content.assert_called_once()
+    assert analyzer.llm.generate_content.call_args[1]["temperature"] == 0.2
+    assert analyzer.llm.generate_content.call_args[1]["top_p"] == 0.8
+    assert analyzer.llm.generate_content.call_args[1]["top_k"] == 40
 
 
 @pytest.mark.asyncio
@@ -73,11 +83,10 @@ async def test_analyze_epic_error_handling(analyzer, mock_execution_log):
 
 
 @pytest.mark.asyncio
-async def test_analyze_complexity_success(analyzer, mock_execution_log):
+async def test_analyze_complexity_success(analyzer, llm_response, mock_parsers):
     # Arrange
     epic_summary = "Test Epic"
     epic_description = "Test Description"
-    mock_response = "LLM Response"
     mock_analysis_data = {
         "analysis": "Test Analysis",
         "story_points": 5,
@@ -86,32 +95,28 @@ async def test_analyze_complexity_success(analyzer, mock_execution_log):
         "technical_factors": ["Factor1"],
         "risk_factors": ["Risk1"]
     }
-    
-    analyzer.llm.generate_content = AsyncMock(return_value=mock_response)
-    with patch('breakdown.epic_analyzer.ComplexityAnalysisParser') as mock_parser:
-        mock_parser.parse = Mock(return_value=mock_analysis_data)
+    mock_parsers["ComplexityAnalysisParser"].parse = Mock(return_value=mock_analysis_data)
 
-        # Act
-        result = await analyzer.analyze_complexity(epic_summary, epic_description)
+    # Act
+    result = await analyzer.analyze_complexity(epic_summary, epic_description)
 
-        # Assert
-        assert isinstance(result, ComplexityAnalysis)
-        assert result.analysis == "Test Analysis"
-        assert result.raw_response == mock_response
-        assert result.story_points == 5
-        assert result.complexity_level == "High"
-        assert result.effort_estimate == "3 days"
-        assert result.technical_factors == ["Factor1"]
-        assert result.risk_factors == ["Risk1"]
+    # Assert
+    assert isinstance(result, ComplexityAnalysis)
+    assert result.analysis == "Test Analysis"
+    assert result.raw_response == llm_response
+    assert result.story_points == 5
+    assert result.complexity_level == "High"
+    assert result.effort_estimate == "3 days"
+    assert result.technical_factors == ["Factor1"]
+    assert result.risk_factors == ["Risk1"]
 
 
 @pytest.mark.asyncio
-async def test_generate_ticket_description_success(analyzer, mock_execution_log):
+async def test_generate_ticket_description_success(analyzer, llm_response, mock_parsers):
     # Arrange
     context = "Test Context"
     requirements = "Test Requirements"
     additional_info = {"key": "value"}
-    mock_response = "LLM Response"
     mock_ticket = TicketDescription(
         title="Test Ticket",
         description="Test Description",
@@ -124,24 +129,22 @@ async def test_generate_ticket_description_success(analyzer, mock_execution_log)
         scenarios=[],
         technical_notes="Test Notes"
     )
-    
-    analyzer.llm.generate_content = AsyncMock(return_value=mock_response)
-    with patch('breakdown.epic_analyzer.TicketDescriptionParser') as mock_parser:
-        mock_parser.parse = Mock(return_value=mock_ticket)
-
-        # Act
-        result = await analyzer.generate_ticket_description(
-            context, requirements, additional_info
-        )
-
-        # Assert
-        assert isinstance(result, TicketDescription)
-        assert result.title == "Test Ticket"
-        assert result.description == "Test Description"
-        assert result.technical_domain == "Test Domain"
-        assert result.required_skills == ["Skill1"]
-        assert result.story_points == 3
-        assert result.suggested_assignee == "Test Assignee"
-        assert result.complexity == "Medium"
-        assert result.acceptance_criteria == ["Criteria1"]
-        assert result.technical_notes == "Test Notes" 
\ No newline at end of file
+
+    mock_parsers["TicketDescriptionParser"].parse = Mock(return_value=mock_ticket)
+
+    # Act
+    result = await analyzer.generate_ticket_description(
+        context, requirements, additional_info
+    )
+
+    # Assert
+    assert isinstance(result, TicketDescription)
+    assert result.title == "Test Ticket"
+    assert result.description == "Test Description"
+    assert result.technical_domain == "Test Domain"
+    assert result.required_skills == ["Skill1"]
+    assert result.story_points == 3
+    assert result.suggested_assignee == "Test Assignee"
+    assert result.complexity == "Medium"
+    assert result.acceptance_criteria == ["Criteria1"]
+    assert result.technical_notes == "Test Notes" 
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock, DEFAULT
 from pathlib import Path
 import json
 
@@ -14,49 +14,40 @@ from models.implementation_notes import ImplementationNotes
 from breakdown.execution_manager import ExecutionManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def epic_key():
     return "TEST-123"
 
 
 @pytest.fixture
-def execution_manager(epic_key):
-    manager = ExecutionManager(epic_key)
-    
-    # Mock services
-    manager.jira_service = Mock()
-    manager.epic_analyzer = Mock()
-    manager.user_story_generator = Mock()
-    manager.technical_task_generator = Mock()
-    manager.subtask_generator = Mock()
-    manager.execution_log = Mock()
-    manager.proposed_tickets = Mock()
-    
-    return manager
+def execution_manager(epic_key, tmp_path, monkeypatch):
+    # __init__ creates its state directory relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    # Mock services so construction does not reach JIRA, MongoDB or the LLM client
+    with patch.multiple(
+        "breakdown.execution_manager",
+        ExecutionLogService=DEFAULT,
+        ProposedTicketsService=DEFAULT,
+        JiraService=DEFAULT,
+        EpicAnalyzer=DEFAULT,
+        UserStoryGenerator=DEFAULT,
+        TechnicalTaskGenerator=DEFAULT,
+        SubtaskGenerator=DEFAULT
+    ):
+        yield ExecutionManager(epic_key)
 
 
-@pytest.fixture
-def mock_execution_log():
-    return Mock()
-
 @pytest.fixture
 def mock_jira():
     return Mock()
 
-@pytest.fixture
-def mock_task_tracker():
-    return Mock()
-
-@pytest.fixture
-def mock_proposed_tickets():
-    return Mock()
-
-
-@pytest.mark.asyncio
-async def test_analyze_epic_details_success(execution_manager, epic_key):
-    # Arrange
-    mock_epic_details = JiraTicketDetails(
-        key=epic_key,
+# Canonical model instances shared by the tests in this module. Pydantic validation makes them
+# comparatively costly to build, and the tests only read them, so each is constructed once.
+@pytest.fixture(scope="module")
+def canonical_epic_details():
+    return JiraTicketDetails(
+        key="TEST-123",
         summary="Test Epic",
         description="Test Description",
         issue_type="Epic",
@@ -70,7 +61,11 @@ async def test_analyze_epic_details_success(execution_manager, epic_key):
         labels=["test"],
         components=["test-component"]
     )
-    mock_analysis = AnalysisInfo(
+
+
+@pytest.fixture(scope="module")
+def canonical_analysis():
+    return AnalysisInfo(
         main_objective="Test Objective",
         technical_domains=["Domain 1"],
         core_requirements=["Req 1"],
@@ -78,85 +73,11 @@ async def test_analyze_epic_details_success(execution_manager, epic_key):
         constraints=["Constraint 1"],
         dependencies=["Dependency 1"]
     )
-    
-    execution_manager.jira.get_ticket = AsyncMock(
-        return_value=mock_epic_details
-    )
-    execution_manager.epic_analyzer.analyze_epic = AsyncMock(
-        return_value=mock_analysis
-    )
-    execution_manager._save_state = Mock()
-
-    # Act
-    epic_details, analysis = await execution_manager.analyze_epic_details()
-
-    # Assert
-    assert epic_details == mock_epic_details
-    assert analysis == mock_analysis
-    execution_manager._save_state.assert_called()
-    execution_manager.jira.get_ticket.assert_called_once_with(epic_key)
-    execution_manager.epic_analyzer.analyze_epic.assert_called_once_with(
-        mock_epic_details.summary,
-        mock_epic_details.description
-    )
-
-
-@pytest.mark.asyncio
-async def test_generate_user_stories_success(execution_manager):
-    # Arrange
-    mock_epic_analysis = AnalysisInfo(
-        main_objective="Test Objective",
-        technical_domains=["Domain 1"],
-        core_requirements=["Req 1"],
-        stakeholders=["Stakeholder 1"]
-    )
-    mock_task_tracker = Mock()
-    mock_stories = [
-        UserStory(
-            id="US-1",
-            title="Test Story",
-            type="User Story",
-            description=StoryDescription(
-                role="developer",
-                goal="implement feature",
-                benefit="improve system",
-                formatted="As a developer, I want to implement feature, so that I can improve system"
-            ),
-            technical_domain="Domain 1",
-            complexity="Medium",
-            business_value="High",
-            story_points=3,
-            required_skills=["Skill1"],
-            suggested_assignee="Test Assignee",
-            dependencies=[],
-            acceptance_criteria=["Criteria1"],
-            implementation_notes=ImplementationNotes()
-        )
-    ]
-    
-    execution_manager.user_story_generator.generate_user_stories = AsyncMock(
-        return_value=mock_stories
-    )
-    execution_manager._save_state = Mock()
-
-    # Act
-    result = await execution_manager.generate_user_stories(
-        mock_epic_analysis,
-        mock_task_tracker
-    )
-
-    # Assert
-    assert len(result) == 1
-    assert isinstance(result[0], UserStory)
-    assert result[0].id == "US-1"
-    assert result[0].title == "Test Story"
-    execution_manager._save_state.assert_called()
 
 
-@pytest.mark.asyncio
-async def test_generate_technical_tasks_success(execution_manager):
-    # Arrange
-    mock_user_stories = [UserStory(
+@pytest.fixture(scope="module")
+def canonical_user_story():
+    return UserStory(
         id="US-1",
         title="Test Story",
         type="User Story",
@@ -175,17 +96,12 @@ async def test_generate_technical_tasks_success(execution_manager):
         dependencies=[],
         acceptance_criteria=["Criteria1"],
         implementation_notes=ImplementationNotes()
-    )]
-    mock_epic_analysis = AnalysisInfo(
-        main_objective="Test Objective",
-        technical_domains=["Domain 1"],
-        core_requirements=["Req 1"],
-        stakeholders=["Stakeholder 1"],
-        constraints=["Constraint 1"],
-        dependencies=["Dependency 1"]
     )
-    mock_task_tracker = Mock()
-    mock_tasks = [TechnicalTask(
+
+
+@pytest.fixture(scope="module")
+def canonical_technical_task():
+    return TechnicalTask(
         id="TT-1",
         title="Test Task",
         type="Technical Task",
@@ -215,7 +131,90 @@ async def test_generate_technical_tasks_success(execution_manager):
         security_considerations="Test security",
         deployment_requirements="Test deployment",
         maintenance_requirements="Test maintenance"
-    )]
+    )
+
+
+@pytest.fixture(scope="module")
+def canonical_subtask():
+    return SubTask(
+        id="ST-1",
+        parent_id="US-1",
+        title="Test Subtask",
+        type="Sub-task",
+        description="Test Description",
+        technical_domain="Domain 1",
+        complexity="Medium",
+        business_value="High",
+        story_points=2,
+        required_skills=["Skill1"],
+        suggested_assignee="Test Assignee",
+        dependencies=[],
+        acceptance_criteria=["Test Criteria"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_analyze_epic_details_success(execution_manager, epic_key, canonical_epic_details, canonical_analysis):
+    # Arrange
+    mock_epic_details = canonical_epic_details
+    mock_analysis = canonical_analysis
+    
+    execution_manager.jira.get_ticket = AsyncMock(
+        return_value=mock_epic_details
+    )
+    execution_manager.epic_analyzer.analyze_epic = AsyncMock(
+        return_value=mock_analysis
+    )
+    execution_manager._save_state = Mock()
+
+    # Act
+    epic_details, analysis = await execution_manager.analyze_epic_details()
+
+    # Assert
+    assert epic_details == mock_epic_details
+    assert analysis == mock_analysis
+    execution_manager._save_state.assert_called()
+    execution_manager.jira.get_ticket.assert_called_once_with(epic_key)
+    execution_manager.epic_analyzer.analyze_epic.assert_called_once_with(
+        mock_epic_details.summary,
+        mock_epic_details.description
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_user_stories_success(execution_manager, canonical_analysis, canonical_user_story):
+    # Arrange
+    mock_epic_analysis = canonical_analysis
+    mock_task_tracker = Mock()
+    mock_stories = [canonical_user_story]
+    
+    execution_manager.user_story_generator.generate_user_stories = AsyncMock(
+        return_value=mock_stories
+    )
+    execution_manager._save_state = Mock()
+
+    # Act
+    result = await execution_manager.generate_user_stories(
+        mock_epic_analysis,
+        mock_task_tracker
+    )
+
+    # Assert
+    assert len(result) == 1
+    assert isinstance(result[0], UserStory)
+    assert result[0].id == "US-1"
+    assert result[0].title == "Test Story"
+    execution_manager._save_state.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_generate_technical_tasks_success(
+        execution_manager, canonical_user_story, canonical_analysis, canonical_technical_task):
+    # Arrange
+    mock_user_stories = [canonical_user_story]
+    mock_epic_analysis = canonical_analysis
+    mock_task_tracker = Mock()
+    mock_tasks = [canonical_technical_task]
     
     execution_manager.technical_task_generator.generate_technical_tasks = AsyncMock(
         return_value=mock_tasks
@@ -241,63 +240,13 @@ async def test_generate_technical_tasks_success(execution_manager):
 
 
 @pytest.mark.asyncio
-async def test_generate_subtasks_success(execution_manager, epic_key):
+async def test_generate_subtasks_success(
+        execution_manager, canonical_user_story, canonical_epic_details, canonical_subtask):
     # Arrange
-    mock_high_level_tasks = [
-        UserStory(
-            id="US-1",
-            title="Test Story",
-            type="User Story",
-            description=StoryDescription(
-                role="developer",
-                goal="implement feature",
-                benefit="improve system",
-                formatted="As a developer, I want to implement feature, so that I can improve system"
-            ),
-            technical_domain="Domain 1",
-            complexity="Medium",
-            business_value="High",
-            story_points=3,
-            required_skills=["Skill1"],
-            suggested_assignee="Test Assignee",
-            dependencies=[],
-            acceptance_criteria=["Criteria1"],
-            implementation_notes=ImplementationNotes()
-        )
-    ]
-    mock_epic_details = JiraTicketDetails(
-        key=epic_key,
-        summary="Test Epic",
-        description="Test Description",
-        issue_type="Epic",
-        status="Open",
-        project_key="TEST",
-        created="2024-01-01T00:00:00.000Z",
-        updated="2024-01-01T00:00:00.000Z",
-        assignee="Test Assignee",
-        reporter="Test Reporter",
-        priority="High",
-        labels=["test"],
-        components=["test-component"]
-    )
+    mock_high_level_tasks = [canonical_user_story]
+    mock_epic_details = canonical_epic_details
     mock_task_tracker = Mock()
-    mock_subtasks = [
-        SubTask(
-            id="ST-1",
-            parent_id="US-1",
-            title="Test Subtask",
-            type="Sub-task",
-            description="Test Description",
-            technical_domain="Domain 1",
-            complexity="Medium",
-            business_value="High",
-            story_points=2,
-            required_skills=["Skill1"],
-            suggested_assignee="Test Assignee",
-            dependencies=[],
-            acceptance_criteria=["Test Criteria"]
-        )
-    ]
+    mock_subtasks = [canonical_subtask]
     
     execution_manager.subtask_generator.break_down_tasks = AsyncMock(
         return_value=mock_subtasks
@@ -363,9 +312,8 @@ def test_load_state_file_not_found(execution_manager):
         execution_manager._load_state("nonexistent.json")
 
 
-def test_load_execution_state_success(tmp_path):
+def test_load_execution_state_success(execution_manager, epic_key, tmp_path):
     # Arrange
-    epic_key = "TEST-123"
     execution_id = "test_execution"
     state_file = "test.json"
     data = {"test": "data"}
@@ -379,53 +327,27 @@ def test_load_execution_state_success(tmp_path):
     with open(filepath, 'w') as f:
         json.dump(data, f)
 
-    # Create a test instance with the temp path
-    manager = ExecutionManager(epic_key)
-    manager.state_dir = state_dir
+    # Point the manager at the temp path
+    execution_manager.state_dir = state_dir
 
     # Act
-    result = manager._load_state(state_file)
+    result = execution_manager._load_state(state_file)
 
     # Assert
     assert result == data
 
 
 @pytest.mark.asyncio
-async def test_execute_breakdown_success(mock_execution_log, mock_jira, mock_task_tracker, mock_proposed_tickets):
+async def test_execute_breakdown_success(execution_manager, epic_key, mock_execution_log, mock_jira, mock_task_tracker,
+                                        mock_proposed_tickets, canonical_epic_details, canonical_analysis):
     # Arrange
-    epic_key = "TEST-123"
-    execution_manager = ExecutionManager(epic_key)
     execution_manager.execution_log = mock_execution_log
     execution_manager.jira = mock_jira
     execution_manager.task_tracker = mock_task_tracker
     execution_manager.proposed_tickets = mock_proposed_tickets
 
-    # Mock epic details
-    mock_epic_details = JiraTicketDetails(
-        key="TEST-123",
-        summary="Test Epic",
-        description="Test Description",
-        issue_type="Epic",
-        status="Open",
-        project_key="TEST",
-        created="2024-01-01T00:00:00.000Z",
-        updated="2024-01-01T00:00:00.000Z",
-        assignee="Test Assignee",
-        reporter="Test Reporter",
-        priority="High",
-        labels=["test"],
-        components=["test-component"]
-    )
-    
-    # Mock epic analysis
-    mock_analysis = AnalysisInfo(
-        main_objective="Test Objective",
-        technical_domains=["Domain 1"],
-        core_requirements=["Req 1"],
-        stakeholders=["Stakeholder 1"],
-        constraints=["Constraint 1"],
-        dependencies=["Dependency 1"]
-    )
+    mock_epic_details = canonical_epic_details
+    mock_analysis = canonical_analysis
 
     # Setup async mocks
     mock_jira.get_ticket = AsyncMock(return_value=mock_epic_details)
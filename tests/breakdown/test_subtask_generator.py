@@ -3,37 +3,58 @@ from unittest.mock import Mock, patch, AsyncMock
 
 from models.sub_task import SubTask
 from models.user_story import UserStory
-from models.technical_task import TechnicalTask
 from models.story_description import StoryDescription
 from models.implementation_notes import ImplementationNotes
-from breakdown.subtask_generator import SubtaskGenerator
 from models.jira_ticket_details import JiraTicketDetails
-
-
-@pytest.fixture
-def mock_execution_log():
-    return Mock()
+from models.code_example import CodeExample
+from models.test_plan import TestPlan
+from models.research_summary import ResearchSummary
+from models.implementation_approach import ImplementationApproach
 
 
 @pytest.fixture
 def generator(mock_execution_log):
+    from llm.vertexllm import VertexLLM
+    from breakdown.subtask_generator import SubtaskGenerator
+
     generator = SubtaskGenerator(mock_execution_log)
-    generator.llm = Mock()
+    generator.llm = Mock(spec_set=VertexLLM)
     generator.execution_log = mock_execution_log
     return generator
 
 
 @pytest.fixture
-def mock_task_tracker():
-    return Mock()
-
-
-@pytest.fixture
-def mock_proposed_tickets():
-    return Mock()
+def mocked_enrichment(generator):
+    """Replace the subtask enrichment steps with canned results for success-path tests"""
+    generator._generate_implementation_approach = AsyncMock(
+        return_value=ImplementationApproach(architecture="test", apis="", database="", security="")
+    )
+    generator._generate_code_examples = AsyncMock(
+        return_value=[CodeExample(language="python", description="test", code="test")]
+    )
+    generator._generate_testing_plan = AsyncMock(
+        return_value=TestPlan(
+            unit_tests=["test"],
+            integration_tests=[],
+            edge_cases=[],
+            performance_tests=[],
+            test_data_requirements=[]
+        )
+    )
+    generator._generate_research_summary = AsyncMock(
+        return_value=ResearchSummary(
+            pain_points="test",
+            success_metrics="",
+            similar_implementations="",
+            modern_approaches=""
+        )
+    )
+    return generator
 
 
-@pytest.fixture
+# The user story is only read by the generator (via model_dump), so it is validated once
+# per module. mock_subtask stays per-test because enrichment rewrites its description.
+@pytest.fixture(scope="module")
 def mock_user_story():
     return UserStory(
         id="US-1",
@@ -57,35 +78,6 @@ def mock_user_story():
     )
 
 
-@pytest.fixture
-def mock_technical_task():
-    return TechnicalTask(
-        id="TT-1",
-        title="Test Technical Task",
-        type="Technical Task",
-        description="Test Description",
-        technical_domain="Test Domain",
-        complexity="Medium",
-        business_value="Medium",
-        story_points=3,
-        required_skills=["Skill1"],
-        suggested_assignee="Test Assignee",
-        dependencies=[],
-        implementation_approach={
-            "approach": "Test approach",
-            "architecture": "Test architecture",
-            "data_flow": "Test data flow",
-            "security": "Test security",
-            "dependencies": "Test dependencies"
-        },
-        acceptance_criteria=["Test Criteria"],
-        performance_impact="Low impact",
-        scalability_considerations="Scales well",
-        monitoring_needs="Basic monitoring",
-        testing_requirements="Unit tests required"
-    )
-
-
 @pytest.fixture
 def mock_subtask():
     return SubTask(
@@ -106,36 +98,13 @@ def mock_subtask():
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("mocked_enrichment")
 @patch('breakdown.subtask_generator.SubtaskParser')
-async def test_break_down_tasks_success(mock_parser, generator, mock_user_story, mock_technical_task, mock_subtask, mock_task_tracker, mock_proposed_tickets):
+async def test_break_down_tasks_success(mock_parser, generator, fake_llm, mock_user_story, make_technical_task, mock_subtask, mock_task_tracker, mock_proposed_tickets):
     # Arrange
     high_level_tasks = [
         mock_user_story,
-        TechnicalTask(
-            id="TT-1",
-            title="Test Technical Task",
-            type="Technical Task",
-            description="Test Description",
-            technical_domain="Test Domain",
-            complexity="Medium",
-            business_value="High",
-            story_points=3,
-            required_skills=["Skill1"],
-            suggested_assignee="Test Assignee",
-            dependencies=[],
-            acceptance_criteria=["Test Criteria"],
-            performance_impact="Low impact",
-            scalability_considerations="Scales well",
-            monitoring_needs="Basic monitoring",
-            testing_requirements="Unit tests required",
-            implementation_approach={
-                "approach": "Test approach",
-                "architecture": "Test architecture",
-                "data_flow": "Test data flow",
-                "security": "Test security",
-                "dependencies": "Test dependencies"
-            }
-        )
+        make_technical_task()
     ]
     epic_details = {
         "key": "EPIC-1",
@@ -152,13 +121,7 @@ async def test_break_down_tasks_success(mock_parser, generator, mock_user_story,
     mock_parser.parse = Mock(return_value=[mock_subtask])
     
     # Mock LLM responses for enrichment methods
-    generator.llm.generate_content = AsyncMock(return_value='{"test": "response"}')
-    
-    # Mock the enrichment methods
-    generator._generate_implementation_approach = AsyncMock(return_value={"approach": "test"})
-    generator._generate_code_examples = AsyncMock(return_value=[{"code": "test"}])
-    generator._generate_testing_plan = AsyncMock(return_value={"tests": ["test"]})
-    generator._generate_research_summary = AsyncMock(return_value={"research": "test"})
+    generator.llm = fake_llm
 
     # Act
     result = await generator.break_down_tasks(
@@ -178,6 +141,13 @@ async def test_break_down_tasks_success(mock_parser, generator, mock_user_story,
     mock_task_tracker.add_subtasks.assert_called()
     mock_proposed_tickets.add_subtasks.assert_called()
 
+    # Verify one subtask prompt per high-level task, each carrying the epic context
+    assert len(fake_llm.calls) == len(high_level_tasks)
+    for (prompt, kwargs), task in zip(fake_llm.calls, high_level_tasks):
+        assert "Key: EPIC-1" in prompt
+        assert task.title in prompt
+        assert kwargs == {}
+
 
 @pytest.mark.asyncio
 async def test_break_down_tasks_empty_tasks(generator, mock_task_tracker, mock_proposed_tickets):
@@ -222,12 +192,12 @@ async def test_break_down_tasks_llm_error(mock_parser, generator, mock_user_stor
 
 @pytest.mark.asyncio
 @patch('breakdown.subtask_generator.SubtaskParser')
-async def test_break_down_tasks_parsing_error(mock_parser, generator, mock_user_story, mock_task_tracker, mock_proposed_tickets):
+async def test_break_down_tasks_parsing_error(mock_parser, generator, fake_llm, mock_user_story, mock_task_tracker, mock_proposed_tickets):
     # Arrange
     high_level_tasks = [mock_user_story]
     epic_details = {"key": "EPIC-1", "summary": "Test Epic"}
     
-    generator.llm.generate_content = AsyncMock(return_value='{"test": "response"}')
+    generator.llm = fake_llm
     mock_parser.parse = Mock(side_effect=ValueError("Parsing error"))
 
     # Act & Assert
@@ -239,11 +209,13 @@ async def test_break_down_tasks_parsing_error(mock_parser, generator, mock_user_
             mock_proposed_tickets
         )
     assert "Parsing error" in str(context.value)
+    [(prompt, _)] = fake_llm.calls
+    assert mock_user_story.title in prompt
 
 
 @pytest.mark.asyncio
 @patch('breakdown.subtask_generator.SubtaskParser')
-async def test_break_down_tasks_tracking_error(mock_parser, generator, mock_user_story, mock_subtask, mock_task_tracker, mock_proposed_tickets):
+async def test_break_down_tasks_tracking_error(mock_parser, generator, fake_llm, mock_user_story, mock_subtask, mock_task_tracker, mock_proposed_tickets):
     # Arrange
     high_level_tasks = [mock_user_story]
     epic_details = JiraTicketDetails(
@@ -263,7 +235,7 @@ async def test_break_down_tasks_tracking_error(mock_parser, generator, mock_user
     ).model_dump()  # Convert to dictionary
     
     mock_parser.return_value.parse.return_value = [mock_subtask]
-    generator.llm.generate_content = AsyncMock(return_value='{"test": "response"}')
+    generator.llm = fake_llm
     
     # Mock tracking error
     mock_task_tracker.add_subtasks.side_effect = Exception("Tracking error")
@@ -277,6 +249,8 @@ async def test_break_down_tasks_tracking_error(mock_parser, generator, mock_user
             mock_proposed_tickets
         )
     assert "Tracking error" in str(context.value)
+    [(prompt, _)] = fake_llm.calls
+    assert "Key: EPIC-1" in prompt
 
 
 @pytest.mark.asyncio
@@ -309,28 +283,30 @@ def test_combine_description(generator):
 def test_format_code_examples(generator):
     # Arrange
     code_examples = [
-        {
-            "description": "Test Example",
-            "language": "python",
-            "code": "def test(): pass"
-        }
+        CodeExample(
+            description="Test Example",
+            language="python",
+            code="def test(): pass"
+        )
     ]
 
     # Act
     result = generator._format_code_examples(code_examples)
 
     # Assert
-    expected = "### Test Example\n```python\ndef test(): pass\n```\n"
+    expected = "### Test Example\n```python\ndef test(): pass\n```\n\n"
     assert result == expected
 
 
 def test_extract_test_criteria(generator):
     # Arrange
-    testing_plan = {
-        "unit_tests": ["Test unit functionality"],
-        "integration_tests": ["Test integration"],
-        "edge_cases": ["Handle null input"]
-    }
+    testing_plan = TestPlan(
+        unit_tests=["Test unit functionality"],
+        integration_tests=["Test integration"],
+        edge_cases=["Handle null input"],
+        performance_tests=[],
+        test_data_requirements=[]
+    )
 
     # Act
     result = generator._extract_test_criteria(testing_plan)
@@ -346,20 +322,25 @@ def test_extract_test_criteria(generator):
 
 def test_format_research_summary(generator):
     # Arrange
-    research = {
-        "pain_points": "Test challenges",
-        "success_metrics": "Test metrics",
-        "modern_approaches": "Test approaches",
-        "performance_considerations": "Test performance",
-        "security_implications": "Test security"
-    }
+    research = ResearchSummary(
+        pain_points="Test challenges",
+        success_metrics="Test metrics",
+        similar_implementations="",
+        modern_approaches="Test approaches",
+        performance_considerations="Test performance",
+        security_implications="Test security"
+    )
 
     # Act
     result = generator._format_research_summary(research)
 
     # Assert
-    assert "**Technical Challenges:**\nTest challenges" in result
-    assert "**Success Metrics:**\nTest metrics" in result
-    assert "**Implementation Approach:**\nTest approaches" in result
-    assert "**Performance Considerations:**\nTest performance" in result
-    assert "**Security Considerations:**\nTest security" in result 
\ No newline at end of file
+    expected_sections = (
+        "**Technical Challenges:**\nTest challenges",
+        "**Success Metrics:**\nTest metrics",
+        "**Implementation Approach:**\nTest approaches",
+        "**Performance Considerations:**\nTest performance",
+        "**Security Considerations:**\nTest security"
+    )
+    missing = [section for section in expected_sections if section not in result]
+    assert not missing, f"missing sections: {missing}" 
\ No newline at end of file
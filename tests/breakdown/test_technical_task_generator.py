@@ -8,33 +8,52 @@ from models.code_block import CodeBlock
 from models.gherkin import GherkinScenario
 from models.story_description import StoryDescription
 from models.implementation_notes import ImplementationNotes
-from breakdown.technical_task_generator import TechnicalTaskGenerator
-
-
-@pytest.fixture
-def mock_execution_log():
-    return Mock()
 
 
 @pytest.fixture
 def generator(mock_execution_log):
+    from llm.vertexllm import VertexLLM
+    from breakdown.technical_task_generator import TechnicalTaskGenerator
+
     generator = TechnicalTaskGenerator(mock_execution_log)
-    generator.llm = Mock()
+    generator.llm = Mock(spec_set=VertexLLM)
     generator.execution_log = mock_execution_log
     return generator
 
 
 @pytest.fixture
-def mock_task_tracker():
-    return Mock()
-
-
-@pytest.fixture
-def mock_proposed_tickets():
-    return Mock()
+def mocked_enrichment(generator):
+    """Replace the technical task enrichment steps with canned results for success-path tests"""
+    generator._generate_research_summary = AsyncMock(
+        return_value=ResearchSummary(
+            pain_points="Test Pain Points",
+            success_metrics="Test Metrics",
+            similar_implementations="Test Similar",
+            modern_approaches="Test Modern"
+        )
+    )
+    generator._generate_code_examples = AsyncMock(
+        return_value=[
+            CodeBlock(
+                language="python",
+                description="Test Code",
+                code="def test(): pass"
+            )
+        ]
+    )
+    generator._generate_gherkin_scenarios = AsyncMock(
+        return_value=[
+            GherkinScenario(
+                name="Test Scenario",
+                steps=[]
+            )
+        ]
+    )
+    return generator
 
 
-@pytest.fixture
+# Read-only user stories shared by the tests in this module
+@pytest.fixture(scope="module")
 def mock_user_stories():
     return [
         UserStory(
@@ -88,8 +107,9 @@ def mock_epic_analysis():
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("mocked_enrichment")
 @patch('breakdown.technical_task_generator.TechnicalTaskParser')
-async def test_generate_technical_tasks_success(mock_parser, generator, mock_user_stories, mock_epic_analysis, mock_task_tracker, mock_proposed_tickets):
+async def test_generate_technical_tasks_success(mock_parser, generator, fake_llm, mock_user_stories, mock_epic_analysis, mock_task_tracker, mock_proposed_tickets):
     # Arrange
     mock_response = "LLM Response"
     mock_tasks = [
@@ -120,36 +140,10 @@ async def test_generate_technical_tasks_success(mock_parser, generator, mock_use
         }
     ]
     
-    generator.llm.generate_content = AsyncMock(return_value=mock_response)
+    fake_llm.default = mock_response
+    generator.llm = fake_llm
     mock_parser.parse_from_response = Mock(return_value=mock_tasks)
     
-    # Mock additional component generation methods
-    generator._generate_research_summary = AsyncMock(
-        return_value=ResearchSummary(
-            pain_points="Test Pain Points",
-            success_metrics="Test Metrics",
-            similar_implementations="Test Similar",
-            modern_approaches="Test Modern"
-        )
-    )
-    generator._generate_code_examples = AsyncMock(
-        return_value=[
-            CodeBlock(
-                language="python",
-                description="Test Code",
-                code="def test(): pass"
-            )
-        ]
-    )
-    generator._generate_gherkin_scenarios = AsyncMock(
-        return_value=[
-            GherkinScenario(
-                name="Test Scenario",
-                steps=[]
-            )
-        ]
-    )
-
     # Mock proposed tickets service to return task ID
     mock_proposed_tickets.add_high_level_task = Mock(return_value="TT-1")
 
@@ -172,85 +166,50 @@ async def test_generate_technical_tasks_success(mock_parser, generator, mock_use
     mock_proposed_tickets.add_high_level_task.assert_called_once()
     generator.execution_log.log_llm_interaction.assert_called()
 
-
-@pytest.mark.asyncio
-@patch('breakdown.technical_task_generator.settings')
-async def test_generate_research_summary_disabled(mock_settings, generator):
-    # Arrange
-    mock_settings.ENABLE_RESEARCH_TASKS = False
-    story_context = {"title": "Test Story"}
-
-    # Act
-    result = await generator._generate_research_summary(story_context)
-
-    # Assert
-    assert isinstance(result, ResearchSummary)
-    generator.llm.generate_content.assert_not_called()
+    # Verify the single task generation prompt covers the stories and the epic analysis
+    [(prompt, kwargs)] = fake_llm.calls
+    assert "Test Story 1" in prompt and "Test Story 2" in prompt
+    assert mock_epic_analysis["main_objective"] in prompt
+    assert kwargs == {"temperature": 0.2}
 
 
 @pytest.mark.asyncio
-@patch('breakdown.technical_task_generator.settings')
-async def test_generate_code_examples_disabled(mock_settings, generator):
+@pytest.mark.parametrize("flag,method,expected", [
+    (
+        "ENABLE_RESEARCH_TASKS",
+        "_generate_research_summary",
+        ResearchSummary(pain_points="", success_metrics="", similar_implementations="", modern_approaches="")
+    ),
+    ("ENABLE_CODE_BLOCK_GENERATION", "_generate_code_examples", []),
+    ("ENABLE_GHERKIN_SCENARIOS", "_generate_gherkin_scenarios", [])
+])
+async def test_generate_component_disabled(flag, method, expected, generator, monkeypatch):
     # Arrange
-    mock_settings.ENABLE_CODE_BLOCK_GENERATION = False
+    monkeypatch.setattr(f"breakdown.technical_task_generator.settings.{flag}", False)
     story_context = {"title": "Test Story"}
 
     # Act
-    result = await generator._generate_code_examples(story_context)
+    result = await getattr(generator, method)(story_context)
 
     # Assert
-    assert result == []
-    generator.llm.generate_content.assert_not_called()
-
-
-@pytest.mark.asyncio
-@patch('breakdown.technical_task_generator.settings')
-async def test_generate_gherkin_scenarios_disabled(mock_settings, generator):
-    # Arrange
-    mock_settings.ENABLE_GHERKIN_SCENARIOS = False
-    story_context = {"title": "Test Story"}
-
-    # Act
-    result = await generator._generate_gherkin_scenarios(story_context)
-
-    # Assert
-    assert result == []
+    assert result == expected
     generator.llm.generate_content.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_generate_technical_tasks_error_handling(
-    generator: TechnicalTaskGenerator,
+    generator,
     mock_task_tracker,
     mock_proposed_tickets,
-    mock_execution_log
+    mock_execution_log,
+    make_user_story
 ):
     """Test that LLM errors are properly logged and handled"""
     # Setup
     test_error = Exception("Test LLM error")
     generator.llm.generate_content.side_effect = test_error
     
-    user_stories = [
-        UserStory(
-            title="Test Story",
-            description=StoryDescription(
-                role="developer",
-                goal="implement feature",
-                benefit="improve system",
-                formatted="As a developer, I want to implement feature, so that I can improve system"
-            ),
-            technical_domain="Domain 1",
-            complexity="Medium",
-            business_value="High",
-            story_points=3,
-            required_skills=["Skill1"],
-            suggested_assignee="Test Assignee",
-            dependencies=[],
-            acceptance_criteria=["Criteria1"],
-            implementation_notes=ImplementationNotes(),
-            type="User Story"
-        )
-    ]
+    user_stories = [make_user_story()]
     epic_analysis = {
         "main_objective": "Test objective",
         "technical_domains": ["Domain 1"],
@@ -7,30 +7,29 @@ from models.code_block import CodeBlock
 from models.gherkin import GherkinScenario, GherkinStep
 from models.story_description import StoryDescription
 from models.implementation_notes import ImplementationNotes
-from breakdown.user_story_generator import UserStoryGenerator
-
-
-@pytest.fixture
-def mock_execution_log():
-    return Mock()
 
 
 @pytest.fixture
 def generator(mock_execution_log):
+    from llm.vertexllm import VertexLLM
+    from breakdown.user_story_generator import UserStoryGenerator
+
     generator = UserStoryGenerator(mock_execution_log)
-    generator.llm = Mock()
+    generator.llm = Mock(spec_set=VertexLLM)
     generator.execution_log = mock_execution_log
     return generator
 
 
 @pytest.fixture
-def mock_task_tracker():
-    return Mock()
+def mock_parser():
+    with patch('breakdown.user_story_generator.UserStoryParser') as parser:
+        yield parser
 
 
 @pytest.fixture
-def mock_proposed_tickets():
-    return Mock()
+def mock_settings():
+    with patch('breakdown.user_story_generator.settings') as settings:
+        yield settings
 
 
 @pytest.fixture
@@ -44,8 +43,7 @@ def mock_epic_analysis():
 
 
 @pytest.mark.asyncio
-@patch('breakdown.user_story_generator.UserStoryParser')
-async def test_generate_user_stories_success(mock_parser, generator, mock_task_tracker, mock_proposed_tickets, mock_epic_analysis):
+async def test_generate_user_stories_success(mock_parser, generator, fake_llm, mock_task_tracker, mock_proposed_tickets, mock_epic_analysis):
     # Arrange
     mock_response = "LLM Response"
     mock_stories = [
@@ -71,7 +69,8 @@ async def test_generate_user_stories_success(mock_parser, generator, mock_task_t
         }
     ]
     
-    generator.llm.generate_content = AsyncMock(return_value=mock_response)
+    fake_llm.default = mock_response
+    generator.llm = fake_llm
     mock_parser.parse_from_response = Mock(return_value=mock_stories)
     
     # Mock additional component generation methods
@@ -126,6 +125,11 @@ async def test_generate_user_stories_success(mock_parser, generator, mock_task_t
     mock_proposed_tickets.add_high_level_task.assert_called_once()
     generator.execution_log.log_llm_interaction.assert_called()
 
+    # Verify the user story prompt is built from the epic analysis
+    prompt, kwargs = fake_llm.calls[0]
+    assert mock_epic_analysis["main_objective"] in prompt
+    assert kwargs == {"temperature": 0.2}
+
 
 @pytest.mark.asyncio
 async def test_generate_user_stories_empty_epic_analysis(generator, mock_task_tracker, mock_proposed_tickets):
@@ -146,58 +150,66 @@ async def test_generate_user_stories_empty_epic_analysis(generator, mock_task_tr
 
 
 @pytest.mark.asyncio
-@patch('breakdown.user_story_generator.UserStoryParser')
-async def test_generate_user_stories_llm_error(mock_parser, generator, mock_task_tracker, mock_proposed_tickets, mock_epic_analysis):
-    # Arrange
-    generator.llm.generate_content = AsyncMock(
-        side_effect=Exception("LLM error")
+@pytest.mark.parametrize("llm_error,parse_error,expected_llm_log,expected_section", [
+    pytest.param(
+        Exception("LLM error"), None,
+        ("User Story Generation", None, "LLM error"), None,
+        id="llm_error"
+    ),
+    pytest.param(
+        None, ValueError("Parsing error"),
+        None, ("User Story Generation Error", "Failed to parse user stories from LLM response"),
+        id="parsing_error"
     )
-
-    # Act & Assert
-    with pytest.raises(Exception) as context:
-        await generator.generate_user_stories(
-            mock_epic_analysis,
-            mock_task_tracker,
-            mock_proposed_tickets
-        )
-    assert "LLM error" in str(context.value)
-
-
-@pytest.mark.asyncio
-@patch('breakdown.user_story_generator.UserStoryParser')
-async def test_generate_user_stories_parsing_error(mock_parser, generator, mock_task_tracker, mock_proposed_tickets, mock_epic_analysis):
+])
+async def test_generate_user_stories_errors(llm_error, parse_error, expected_llm_log, expected_section, mock_parser,
+                                            generator, mock_task_tracker, mock_proposed_tickets, mock_epic_analysis):
     # Arrange
-    mock_response = "Invalid Response"
-    generator.llm.generate_content = AsyncMock(return_value=mock_response)
-    mock_parser.parse_from_response = Mock(side_effect=ValueError("Parsing error"))
+    generator.llm.generate_content = AsyncMock(return_value="Invalid Response", side_effect=llm_error)
+    mock_parser.parse_from_response = Mock(side_effect=parse_error)
+    expected_error = llm_error or parse_error
 
     # Act & Assert
-    with pytest.raises(ValueError) as context:
+    with pytest.raises(type(expected_error), match=str(expected_error)):
         await generator.generate_user_stories(
             mock_epic_analysis,
             mock_task_tracker,
             mock_proposed_tickets
         )
-    assert "Parsing error" in str(context.value)
+
+    # Parsing errors are logged as a section; LLM errors as an interaction without a response
+    if expected_llm_log:
+        generator.execution_log.log_llm_interaction.assert_called_once_with(*expected_llm_log)
+    else:
+        generator.execution_log.log_llm_interaction.assert_not_called()
+    if expected_section:
+        generator.execution_log.log_section.assert_called_once_with(*expected_section)
 
 
 @pytest.mark.asyncio
-@patch('breakdown.user_story_generator.settings')
-async def test_generate_research_summary_disabled(mock_settings, generator):
+@pytest.mark.parametrize("flag,method,expected", [
+    (
+        "ENABLE_RESEARCH_TASKS",
+        "_generate_research_summary",
+        ResearchSummary(pain_points="", success_metrics="", similar_implementations="", modern_approaches="")
+    ),
+    ("ENABLE_CODE_BLOCK_GENERATION", "_generate_code_examples", []),
+    ("ENABLE_GHERKIN_SCENARIOS", "_generate_gherkin_scenarios", [])
+])
+async def test_generate_component_disabled(flag, method, expected, generator, monkeypatch):
     # Arrange
-    mock_settings.ENABLE_RESEARCH_TASKS = False
+    monkeypatch.setattr(f"breakdown.user_story_generator.settings.{flag}", False)
     story_context = {"title": "Test Story"}
 
     # Act
-    result = await generator._generate_research_summary(story_context)
+    result = await getattr(generator, method)(story_context)
 
     # Assert
-    assert isinstance(result, ResearchSummary)
+    assert result == expected
     generator.llm.generate_content.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch('breakdown.user_story_generator.settings')
 async def test_generate_research_summary_error(mock_settings, generator):
     # Arrange
     mock_settings.ENABLE_RESEARCH_TASKS = True
@@ -213,94 +225,7 @@ async def test_generate_research_summary_error(mock_settings, generator):
 
 
 @pytest.mark.asyncio
-@patch('breakdown.user_story_generator.settings')
-async def test_generate_code_examples_disabled(mock_settings, generator):
-    # Arrange
-    mock_settings.ENABLE_CODE_BLOCK_GENERATION = False
-    story_context = {"title": "Test Story"}
-
-    # Act
-    result = await generator._generate_code_examples(story_context)
-
-    # Assert
-    assert result == []
-    generator.llm.generate_content.assert_not_called()
-
-
-@pytest.mark.asyncio
-@patch('breakdown.user_story_generator.settings')
-async def test_generate_gherkin_scenarios_disabled(mock_settings, generator):
-    # Arrange
-    mock_settings.ENABLE_GHERKIN_SCENARIOS = False
-    story_context = {"title": "Test Story"}
-
-    # Act
-    result = await generator._generate_gherkin_scenarios(story_context)
-
-    # Assert
-    assert result == []
-    generator.llm.generate_content.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_generate_user_stories_error_handling(generator, mock_task_tracker, mock_proposed_tickets):
-    # Arrange
-    epic_analysis = {"main_objective": "Test", "technical_domains": ["Domain1"]}
-    generator.llm.generate_content = AsyncMock(side_effect=Exception("Test error"))
-    generator.execution_log.log_llm_interaction = Mock()
-
-    # Act & Assert
-    with pytest.raises(Exception) as exc:
-        await generator.generate_user_stories(epic_analysis, mock_task_tracker, mock_proposed_tickets)
-
-    assert str(exc.value) == "Test error"
-    generator.execution_log.log_llm_interaction.assert_called_once_with(
-        "User Story Generation",
-        None,  # No response since an error occurred
-        "Test error"
-    )
-
-
-@pytest.mark.asyncio
-@patch('breakdown.user_story_generator.UserStoryParser')
-async def test_generate_user_stories_with_invalid_story_data(mock_parser, generator, mock_task_tracker, mock_proposed_tickets):
-    # Arrange
-    epic_analysis = {
-        "main_objective": "Test",
-        "technical_domains": ["Domain1"],
-        "core_requirements": ["Req1"],
-        "stakeholders": ["Stakeholder1"],
-        "constraints": ["Constraint1"],
-        "dependencies": ["Dependency1"]
-    }
-    
-    # Mock LLM response with invalid data
-    generator.llm.generate_content = AsyncMock(return_value='{"invalid": "data"}')
-    
-    # Setup parser to raise ValueError
-    mock_parser.parse_from_response = Mock(side_effect=ValueError("Invalid story data"))
-    
-    # Act
-    with pytest.raises(ValueError) as exc_info:
-        await generator.generate_user_stories(epic_analysis, mock_task_tracker, mock_proposed_tickets)
-    
-    # Assert
-    assert str(exc_info.value) == "Invalid story data"
-    
-    # Verify section logging was called
-    generator.execution_log.log_section.assert_called_once_with(
-        "User Story Generation Error",
-        "Failed to parse user stories from LLM response"
-    )
-    
-    # Note: For parsing errors, log_llm_interaction is NOT called based on the implementation
-    # so we verify it was NOT called
-    generator.execution_log.log_llm_interaction.assert_not_called()
-
-
-@pytest.mark.asyncio
-@patch('breakdown.user_story_generator.UserStoryParser')
-async def test_generate_user_stories_with_tracking_error(mock_parser, generator, mock_task_tracker, mock_proposed_tickets):
+async def test_generate_user_stories_with_tracking_error(mock_parser, generator, fake_llm, mock_task_tracker, mock_proposed_tickets):
     # Arrange
     epic_analysis = {
         "main_objective": "Test",
@@ -333,7 +258,8 @@ async def test_generate_user_stories_with_tracking_error(mock_parser, generator,
     }
     
     # Setup mocks
-    generator.llm.generate_content = AsyncMock(return_value='{"valid": "story"}')
+    fake_llm.default = '{"valid": "story"}'
+    generator.llm = fake_llm
     mock_parser.parse_from_response = Mock(return_value=[mock_story])
     mock_task_tracker.add_user_story = Mock(side_effect=Exception("Tracking error"))
     
@@ -347,4 +273,7 @@ async def test_generate_user_stories_with_tracking_error(mock_parser, generator,
     mock_task_tracker.add_user_story.assert_called_once()
     
     # Verify error was logged
-    generator.execution_log.log_llm_interaction.assert_called() 
\ No newline at end of file
+    generator.execution_log.log_llm_interaction.assert_called()
+    prompt, kwargs = fake_llm.calls[0]
+    assert epic_analysis["core_requirements"][0] in prompt
+    assert kwargs == {"temperature": 0.2} 
\ No newline at end of file
@@ -0,0 +1,68 @@
+from parsers.base_parser import BaseParser
+
+
+def test_iter_tagged_yields_blocks_in_order():
+    content = "intro <item>one</item> middle <item>\ntwo\n</item> outro"
+
+    assert list(BaseParser._iter_tagged(content, "item")) == ["one", "\ntwo\n"]
+
+
+def test_iter_tagged_include_tags():
+    content = "<subtask>a</subtask>\n<subtask>b</subtask>"
+
+    assert list(BaseParser._iter_tagged(content, "subtask", include_tags=True)) == [
+        "<subtask>a</subtask>",
+        "<subtask>b</subtask>"
+    ]
+
+
+def test_iter_tagged_stops_at_unclosed_tag():
+    content = "<item>closed</item><item>never closed"
+
+    assert list(BaseParser._iter_tagged(content, "item")) == ["closed"]
+
+
+def test_extract_between_tags_returns_first_block():
+    assert BaseParser.extract_between_tags("<a>1</a><a>2</a>", "a") == "1"
+    assert BaseParser.extract_between_tags("<a>1", "a") is None
+    assert BaseParser.extract_between_tags("", "a") is None
+
+
+def test_clean_bullet():
+    assert BaseParser._clean_bullet("  - item one ") == "item one"
+    assert BaseParser._clean_bullet("• item") == "item"
+    assert BaseParser._clean_bullet("* - nested") == "nested"
+    assert BaseParser._clean_bullet(" - ") is None
+    assert BaseParser._clean_bullet("") is None
+
+
+def test_extract_list_items_skips_blank_lines():
+    content = "- first\n\n   \n2. second\nthird"
+
+    assert BaseParser.extract_list_items(content) == ["first", "second", "third"]
+
+
+def test_extract_section_with_missing_end_marker():
+    content = "Description:" + " " * 5000 + "text without a terminator"
+
+    assert BaseParser.extract_section(content, "Description", r"\nTechnical Domain:") is None
+    assert BaseParser.extract_section("Title:   Name\nNext: x", "Title") == "Name"
+
+
+def test_extract_section_defaults_to_a_single_line():
+    content = "Title: First line\nsecond line\nDescription: Body"
+
+    assert BaseParser.extract_section(content, "Title") == "First line"
+    assert BaseParser.extract_section(content, "Description") == "Body"
+    assert BaseParser.extract_section("Title:   \n", "Title") is None
+
+
+def test_preview_bounds_long_text():
+    assert BaseParser._preview("short") == "short"
+    assert BaseParser._preview("x" * 510, limit=500) == "x" * 500 + "... [10 more characters]"
+
+
+def test_is_json_object():
+    assert BaseParser._is_json_object({"title": "Story"}, "User story")
+    assert not BaseParser._is_json_object(["title"], "User story")
+    assert not BaseParser._is_json_object("title", "User story")
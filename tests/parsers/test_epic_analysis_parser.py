@@ -0,0 +1,32 @@
+from parsers.epic_analysis_parser import EpicAnalysisParser
+
+
+def test_parse_keeps_bulleted_items_that_start_with_angle_brackets():
+    analysis = EpicAnalysisParser.parse(
+        "<analysis>\n"
+        "<main_objective>Ship the login flow</main_objective>\n"
+        "<stakeholders>\n"
+        "- <placeholder> team\n"
+        "<!-- stray markup -->\n"
+        "* Product owners\n"
+        "\n"
+        "</stakeholders>\n"
+        "</analysis>"
+    )
+
+    assert analysis["main_objective"] == "Ship the login flow"
+    assert analysis["stakeholders"] == ["<placeholder> team", "Product owners"]
+
+
+def test_parse_splits_crlf_sections_into_clean_items():
+    analysis = EpicAnalysisParser.parse(
+        "<analysis>\r\n"
+        "<core_requirements>\r\n"
+        "- Single sign-on\r\n"
+        "<br>\r\n"
+        "- Audit log\r\n"
+        "</core_requirements>\r\n"
+        "</analysis>"
+    )
+
+    assert analysis["core_requirements"] == ["Single sign-on", "Audit log"]
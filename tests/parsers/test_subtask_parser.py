@@ -0,0 +1,27 @@
+from parsers.subtask_parser import SubtaskParser
+
+
+def test_extract_code_blocks_keeps_angle_brackets_in_code():
+    content = (
+        "<code language='java'>List<String> names = new ArrayList<>();</code>"
+        "<code language=\"\">if (a < b) {}</code>"
+    )
+
+    assert SubtaskParser._extract_code_blocks(content) == [
+        {"language": "java", "code": "List<String> names = new ArrayList<>();"},
+        {"language": "text", "code": "if (a < b) {}"}
+    ]
+
+
+def test_clean_xml_content_preserves_newlines_in_code():
+    content = "<desc>\r\n  spaced   out </desc>\n<code language='py'>a = 1\nif a < 2: pass\nprint(a)</code>"
+
+    assert SubtaskParser._clean_xml_content(content) == (
+        "<desc> spaced out </desc> <code language='py'>a = 1\nif a < 2: pass\nprint(a)</code>"
+    )
+
+
+def test_parse_story_points_only_reads_ascii_digits():
+    assert SubtaskParser._parse_story_points(" 8 ") == 8
+    assert SubtaskParser._parse_story_points("about 7 points") == 8
+    assert SubtaskParser._parse_story_points("٥") == 3
@@ -0,0 +1,187 @@
+import pytest
+
+from parsers.ticket_description_parser import TicketDescriptionParser
+
+TICKET_RESPONSE = """Here is the ticket:
+<ticket>
+Title: Build login page
+Description: Users need to log in.
+It should be secure.
+Technical Domain: Frontend
+Required Skills: React, TypeScript , CSS
+Story Points: 5
+Suggested Assignee: Alice
+Complexity: Medium
+Acceptance Criteria:
+- User can log in
+* Errors are shown
+1. Remember me works
+
+Scenarios:
+Scenario: Successful login
+Given a registered user
+When they submit valid credentials
+Then they see the dashboard
+And a session cookie is set
+Scenario: Failed login
+Given a registered user
+When they submit invalid credentials
+Then an error is shown
+Technical Notes: Use OAuth2.
+</ticket>
+"""
+
+
+def test_parse_ticket_fields():
+    ticket = TicketDescriptionParser.parse(TICKET_RESPONSE)
+
+    assert ticket.title == "Build login page"
+    assert ticket.description == "Users need to log in.\nIt should be secure."
+    assert ticket.technical_domain == "Frontend"
+    assert ticket.required_skills == ["React", "TypeScript", "CSS"]
+    assert ticket.story_points == 5
+    assert ticket.suggested_assignee == "Alice"
+    assert ticket.complexity == "Medium"
+    assert ticket.acceptance_criteria == ["User can log in", "Errors are shown", "Remember me works"]
+    assert ticket.technical_notes == "Use OAuth2."
+
+
+def test_parse_ticket_scenarios():
+    ticket = TicketDescriptionParser.parse(TICKET_RESPONSE)
+
+    assert [scenario.name for scenario in ticket.scenarios] == ["Successful login", "Failed login"]
+    assert [(step.keyword, step.text) for step in ticket.scenarios[0].steps] == [
+        ("Given", "a registered user"),
+        ("When", "they submit valid credentials"),
+        ("Then", "they see the dashboard"),
+        ("And", "a session cookie is set")
+    ]
+    assert len(ticket.scenarios[1].steps) == 3
+
+
+def test_parse_ticket_multiline_sections_run_until_next_header():
+    response = """<ticket>
+Title: Export report
+Technical Domain: Backend
+Description: Generate a CSV export.
+
+Story Points: 3
+Scenarios:
+Scenario: Export succeeds
+Given a report
+When it is exported
+Then a CSV is returned
+
+Technical Notes:
+Stream rows to avoid loading everything in memory.
+</ticket>"""
+
+    ticket = TicketDescriptionParser.parse(response)
+
+    assert ticket.description == "Generate a CSV export."
+    assert ticket.story_points == 3
+    assert [scenario.name for scenario in ticket.scenarios] == ["Export succeeds"]
+    assert ticket.technical_notes == "Stream rows to avoid loading everything in memory."
+
+
+def test_parse_ticket_without_tags_raises():
+    with pytest.raises(ValueError):
+        TicketDescriptionParser.parse("No ticket here")
+
+
+def test_parse_scenarios_only_matches_tokens_at_line_start():
+    scenarios = TicketDescriptionParser._parse_scenarios(
+        "Scenario: Retry upload\n"
+        "  Given an upload that failed When the network dropped\n"
+        "Note: Then this line is not a step\n"
+        "  Then the upload is retried\n"
+    )
+
+    assert [(step.keyword, step.text) for step in scenarios[0].steps] == [
+        ("Given", "an upload that failed When the network dropped"),
+        ("Then", "the upload is retried")
+    ]
+
+
+def test_parse_ticket_skips_empty_skills():
+    ticket = TicketDescriptionParser.parse("<ticket>\nTitle: X\nRequired Skills: Python, , SQL,\n</ticket>")
+
+    assert ticket.required_skills == ["Python", "SQL"]
+
+
+def test_parse_scenarios_accepts_bulleted_and_numbered_steps():
+    scenarios = TicketDescriptionParser._parse_scenarios(
+        "- Scenario: Reset password\n"
+        "  - Given a registered user\n"
+        "  * When they request a reset link\n"
+        "  1. Then an email is sent\n"
+        "  • And the link expires in an hour\n"
+    )
+
+    assert [scenario.name for scenario in scenarios] == ["Reset password"]
+    assert [(step.keyword, step.text) for step in scenarios[0].steps] == [
+        ("Given", "a registered user"),
+        ("When", "they request a reset link"),
+        ("Then", "an email is sent"),
+        ("And", "the link expires in an hour")
+    ]
+
+
+def test_parse_scenarios_accepts_bold_scenario_header():
+    scenarios = TicketDescriptionParser._parse_scenarios(
+        "**Scenario:** Reset password\n"
+        "- Given a registered user\n"
+        "- Then an email is sent\n"
+    )
+
+    assert [scenario.name for scenario in scenarios] == ["Reset password"]
+    assert [step.keyword for step in scenarios[0].steps] == ["Given", "Then"]
+
+
+def test_parse_ticket_accepts_bold_and_bulleted_headers():
+    ticket = TicketDescriptionParser.parse(
+        "<ticket>\n"
+        "**Title:** Build login page\n"
+        "- Technical Domain: Frontend\n"
+        "**Story Points**: 3\n"
+        "* Complexity: Low\n"
+        "</ticket>"
+    )
+
+    assert ticket.title == "Build login page"
+    assert ticket.technical_domain == "Frontend"
+    assert ticket.story_points == 3
+    assert ticket.complexity == "Low"
+
+
+def test_parse_ticket_keeps_bulleted_field_names_inside_multi_line_sections():
+    ticket = TicketDescriptionParser.parse(
+        "<ticket>\n"
+        "Title: Build login page\n"
+        "Acceptance Criteria:\n"
+        "- Description: shown under the form\n"
+        "- Errors are shown\n"
+        "Technical Notes:\n"
+        "- Complexity: O(n) in the number of sessions\n"
+        "Complexity: Low\n"
+        "</ticket>"
+    )
+
+    assert ticket.description == ""
+    assert ticket.acceptance_criteria == ["Description: shown under the form", "Errors are shown"]
+    assert ticket.technical_notes == "- Complexity: O(n) in the number of sessions"
+    assert ticket.complexity == "Low"
+
+
+def test_parse_scenarios_starts_a_scenario_for_a_bare_header():
+    scenarios = TicketDescriptionParser._parse_scenarios(
+        "Scenario: Reset password\n"
+        "Given a registered user\n"
+        "Scenario:\n"
+        "When the reset link has expired\n"
+        "Then an error is shown\n"
+    )
+
+    assert [scenario.name for scenario in scenarios] == ["Reset password", ""]
+    assert [step.keyword for step in scenarios[0].steps] == ["Given"]
+    assert [step.keyword for step in scenarios[1].steps] == ["When", "Then"]
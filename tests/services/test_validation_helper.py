@@ -0,0 +1,39 @@
+from services.validation_helper import ValidationHelper
+
+TASK = {
+    "type": "User Story",
+    "name": "Login",
+    "description": "As a user I want to log in",
+    "technical_domain": "Frontend",
+    "complexity": "Medium",
+    "dependencies": [],
+    "business_value": "High"
+}
+SUBTASK = {
+    "title": "Build form",
+    "description": "Create the login form",
+    "acceptance_criteria": "Form submits",
+    "story_points": 3,
+    "required_skills": ["React"],
+    "dependencies": [],
+    "suggested_assignee": "Frontend Developer"
+}
+
+
+def test_validate_task_structure_uses_type_specific_fields():
+    assert ValidationHelper.validate_task_structure(TASK, "User Story")
+    assert not ValidationHelper.validate_task_structure(TASK, "Technical Task")
+    assert not ValidationHelper.validate_task_structure({**TASK, "dependencies": "none"}, "User Story")
+
+
+def test_validate_subtask_structure():
+    assert ValidationHelper.validate_subtask_structure(SUBTASK)
+    assert not ValidationHelper.validate_subtask_structure({**SUBTASK, "story_points": "3"})
+    assert not ValidationHelper.validate_subtask_structure({"title": "Only a title"})
+    assert not ValidationHelper.validate_subtask_structure(None)
+
+
+def test_validate_task_group_fails_on_any_invalid_subtask():
+    assert ValidationHelper.validate_task_group({"high_level_task": TASK, "subtasks": [SUBTASK]})
+    assert not ValidationHelper.validate_task_group({"high_level_task": TASK, "subtasks": [SUBTASK, {}]})
+    assert not ValidationHelper.validate_task_group({"high_level_task": TASK, "subtasks": "none"})
@@ -4,6 +4,19 @@ from typing import Any, Dict, List, Union
 
 from loguru import logger
 
+# Patterns used to locate JSON inside free-form LLM responses, in priority order
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```', re.ASCII)
+_JSON_ARRAY_RE = re.compile(r'\[\s*{.*}\s*\]', re.DOTALL | re.ASCII)
+_JSON_OBJECT_RE = re.compile(r'{\s*".*}\s*', re.DOTALL | re.ASCII)
+
+# Repairs for common LLM JSON formatting issues, applied in order by _fix_common_issues
+_UNESCAPED_VALUE_QUOTE_RE = re.compile(r':\s*"([^"]*?)(?<!\\)"([^"]*?)"')
+_UNESCAPED_ARRAY_QUOTE_RE = re.compile(r'\[\s*"([^"]*?)(?<!\\)"([^"]*?)"\s*\]')
+_UNQUOTED_KEY_RE = re.compile(r'(\w+)(?=\s*:)')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])', re.ASCII)
+_UNQUOTED_VALUE_RE = re.compile(r':\s*([^"{}\[\]\s,]+)([,}])')
+_STRING_NEWLINE_RE = re.compile(r'"\s*\n\s*([^"]+)\s*\n\s*"')
+
 
 class JSONSanitizer:
     """Utility class to sanitize and repair malformed JSON from LLM responses"""
@@ -27,7 +40,7 @@ class JSONSanitizer:
             logger.debug("Initial JSON parse failed, attempting repairs")
 
             # First, check if this is a Markdown code block
-            code_block_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', json_str)
+            code_block_match = _CODE_BLOCK_RE.search(json_str)
             if code_block_match:
                 logger.debug("Found markdown code block, extracting content")
                 extracted_content = code_block_match.group(1).strip()
@@ -97,37 +110,37 @@ class JSONSanitizer:
         changes_made = []
 
         # Fix unescaped quotes in property values
-        new_str = re.sub(r':\s*"([^"]*?)(?<!\\)"([^"]*?)"', r': "\1\\\"\2"', json_str)
+        new_str = _UNESCAPED_VALUE_QUOTE_RE.sub(r': "\1\\\"\2"', json_str)
         if new_str != json_str:
             changes_made.append("Fixed unescaped quotes in property values")
             json_str = new_str
 
         # Fix unescaped quotes in string arrays
-        new_str = re.sub(r'\[\s*"([^"]*?)(?<!\\)"([^"]*?)"\s*\]', r'["\1\\\"\2"]', json_str)
+        new_str = _UNESCAPED_ARRAY_QUOTE_RE.sub(r'["\1\\\"\2"]', json_str)
         if new_str != json_str:
             changes_made.append("Fixed unescaped quotes in string arrays")
             json_str = new_str
 
         # Ensure property names are properly quoted
-        new_str = re.sub(r'(\w+)(?=\s*:)', r'"\1"', json_str)
+        new_str = _UNQUOTED_KEY_RE.sub(r'"\1"', json_str)
         if new_str != json_str:
             changes_made.append("Added quotes to property names")
             json_str = new_str
 
         # Fix trailing commas in objects and arrays
-        new_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+        new_str = _TRAILING_COMMA_RE.sub(r'\1', json_str)
         if new_str != json_str:
             changes_made.append("Removed trailing commas")
             json_str = new_str
 
         # Fix missing quotes around property values
-        new_str = re.sub(r':\s*([^"{}\[\]\s,]+)([,}])', r': "\1"\2', json_str)
+        new_str = _UNQUOTED_VALUE_RE.sub(r': "\1"\2', json_str)
         if new_str != json_str:
             changes_made.append("Added quotes around property values")
             json_str = new_str
 
         # Fix newlines in string values
-        new_str = re.sub(r'"\s*\n\s*([^"]+)\s*\n\s*"', lambda m: f'"{m.group(1)}"', json_str)
+        new_str = _STRING_NEWLINE_RE.sub(lambda m: f'"{m.group(1)}"', json_str)
         if new_str != json_str:
             changes_made.append("Fixed newlines in string values")
             json_str = new_str
@@ -144,19 +157,19 @@ class JSONSanitizer:
         """Extract JSON content from LLM response"""
         logger.debug("Attempting to extract JSON content")
 
-        # Try to find JSON array or object
-        array_match = re.search(r'\[\s*{.*}\s*\]', content, re.DOTALL)
-        object_match = re.search(r'{\s*".*}\s*', content, re.DOTALL)
-
+        # Try to find JSON array or object, only scanning for the object when no array is present
+        array_match = _JSON_ARRAY_RE.search(content)
         if array_match:
             logger.debug("Found JSON array structure")
             return array_match.group(0)
-        elif object_match:
+
+        object_match = _JSON_OBJECT_RE.search(content)
+        if object_match:
             logger.debug("Found JSON object structure")
             return object_match.group(0)
 
         # If no clear JSON structure found, try to find content between code blocks
-        code_block_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', content)
+        code_block_match = _CODE_BLOCK_RE.search(content)
         if code_block_match:
             logger.debug("Found JSON content in code block")
             return code_block_match.group(1)